@@ -0,0 +1,16 @@
+import os
+
+# Production server settings, used with:  gunicorn -c gunicorn.conf.py server:app  (run from app/)
+# Sessions, the driver pool and the background executor live in process memory, so
+# concurrency comes from threads in ONE worker: a second worker would not see the
+# session a status/stream request refers to.
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+workers = 1
+# Threaded workers because Selenium and the SSE streams are blocking IO
+worker_class = "gthread"
+# Each open /api/job-status-stream/<id> or /api/apply-status-stream/<id> connection
+# holds a thread until its terminal stage (at most SSE_MAX_STREAM_SECONDS in server.py)
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+timeout = 180
+graceful_timeout = 30
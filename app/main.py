@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+import logging
 from typing import Dict, List
 
 # Get the absolute path of the app directory
@@ -128,6 +129,8 @@ def display_matches(matches: List[Dict], resume_name: str):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("\n" + "="*70)
     print("🔵 LINKEDIN JOB-RESUME MATCHING & AUTO-APPLY SYSTEM")
     print("="*70)
@@ -1,9 +1,9 @@
 import re
 import os
 import sys
+import heapq
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from typing import List, Dict
 
 # FIXED: Import job_description_parser from parsers folder
@@ -39,6 +39,9 @@ except ImportError:
             print(f"   Error: {e}")
             HAVE_JD_PARSER = False
 
+# Weights of similarity, experience, location, skills and title relevance in the final score
+_SCORE_WEIGHTS = np.array([0.30, 0.20, 0.10, 0.35, 0.05])
+
 
 class JobMatcher:
     """
@@ -51,7 +54,9 @@ class JobMatcher:
             stop_words='english',
             ngram_range=(1, 2),
             min_df=1,
-            max_df=0.95
+            max_df=0.95,
+            # Rows come out unit length, so cosine similarity is a plain dot product
+            norm='l2'
         )
         self.job_vectors = None
         self.resume_vector = None
@@ -327,24 +332,21 @@ class JobMatcher:
         
         return min(1.0, matches / len(title_terms))
     
-    def scale_score_realistically(self, raw_score: float, skills_analysis: Dict) -> float:
-        """Scale scores to be more realistic (most jobs should score 20-80%)"""
+    def scale_scores_realistically(self, raw_scores: np.ndarray, skill_percentages: np.ndarray) -> np.ndarray:
+        """Scale scores to be more realistic (most jobs should score 20-80%), for all jobs at once"""
         # Base scaling to prevent extreme scores
-        scaled_score = raw_score * 0.85 + 0.10
-        
-        # Adjust based on skills match
-        skill_percentage = skills_analysis.get('match_percentage', 0)
+        scaled = raw_scores * 0.85 + 0.10
         
-        if skill_percentage == 0:
-            scaled_score = min(scaled_score, 0.35)
-        elif skill_percentage < 20:
-            scaled_score = min(scaled_score, 0.45)
-        elif skill_percentage < 40:
-            scaled_score = min(scaled_score, 0.60)
-        elif skill_percentage > 80:
-            scaled_score = min(0.92, scaled_score * 1.08)
+        # Cap based on skills match: none / <20% / <40%, and a boost above 80%
+        caps = np.select(
+            [skill_percentages == 0, skill_percentages < 20, skill_percentages < 40],
+            [0.35, 0.45, 0.60],
+            default=np.inf
+        )
+        scaled = np.minimum(scaled, caps)
+        scaled = np.where(skill_percentages > 80, np.minimum(0.92, scaled * 1.08), scaled)
         
-        return max(0.05, min(0.95, scaled_score))
+        return np.clip(scaled, 0.05, 0.95)
     
     def fit_transform(self, jobs: List[Dict], resume_text: str) -> None:
         """Fit vectorizer and transform job and resume texts"""
@@ -388,8 +390,8 @@ class JobMatcher:
         # Always fit and transform
         self.fit_transform(jobs, resume_text)
         
-        # Calculate cosine similarity
-        similarities = cosine_similarity(self.resume_vector, self.job_vectors).flatten()
+        # Cosine similarity: TF-IDF rows are already L2-normalised, so one sparse dot product
+        similarities = (self.job_vectors @ self.resume_vector.T).toarray().ravel()
         
         print(f"\n📊 Similarity Analysis:")
         print(f"   Range: {similarities.min():.3f} to {similarities.max():.3f}")
@@ -407,16 +409,17 @@ class JobMatcher:
         resume_location = self.extract_resume_location(resume_text)
         resume_experience = self.extract_resume_experience(resume_text)
         
-        # Calculate scores for each job
-        results = []
+        # Per-job component scores, one row per job in _SCORE_WEIGHTS column order
+        components = np.empty((len(jobs), len(_SCORE_WEIGHTS)))
+        # Basic similarity score
+        components[:, 0] = np.clip(similarities, 0.0, 1.0)
+        skills_analyses = []
+        
         for i, job in enumerate(jobs):
             print(f"\n{'─'*70}")
             print(f"   Job {i+1}: {job.get('title', 'Unknown')[:50]}")
             print(f"   Company: {job.get('company', 'Unknown')[:40]}")
             
-            # Basic similarity score
-            similarity_score = max(0.0, min(1.0, float(similarities[i])))
-            
             # Build job text for experience matching and skill extraction
             job_title = job.get('title', '')
             job_summary = job.get('summary', '')
@@ -439,40 +442,38 @@ class JobMatcher:
             print(f"      Total job skills: {len(job_skills)}")
             
             skills_analysis = self.calculate_skills_match_advanced(job_skills, resume_skills)
-            skills_score = skills_analysis['overall_score']
+            skills_analyses.append(skills_analysis)
             
             # Job title relevance
             title_relevance = self.calculate_title_relevance(job_title, resume_text)
             
-            # Calculate weighted final score
-            final_score = (
-                similarity_score * 0.30 +
-                experience_score * 0.20 +
-                location_score * 0.10 +
-                skills_score * 0.35 +
-                title_relevance * 0.05
-            )
-            
-            # Apply realistic scaling
-            final_score = self.scale_score_realistically(final_score, skills_analysis)
-            
-            print(f"      Final Match: {final_score:.1%}")
+            components[i, 1:] = (experience_score, location_score,
+                                 skills_analysis['overall_score'], title_relevance)
+        
+        # Weighted final score and realistic scaling for every job in one go
+        skill_percentages = np.array([a['match_percentage'] for a in skills_analyses], dtype=float)
+        final_scores = self.scale_scores_realistically(components @ _SCORE_WEIGHTS, skill_percentages)
+        
+        results = []
+        for i, (job, skills_analysis) in enumerate(zip(jobs, skills_analyses)):
+            final_score = float(final_scores[i])
+            print(f"   Job {i+1} Final Match: {final_score:.1%}")
             
-            # Build result
-            result = {
+            similarity_score, experience_score, location_score, skills_score, title_relevance = (
+                round(score, 3) for score in components[i].tolist()
+            )
+            results.append({
                 'job': job,
-                'similarity_score': round(similarity_score, 3),
-                'experience_score': round(experience_score, 3),
-                'location_score': round(location_score, 3),
-                'skills_score': round(skills_score, 3),
-                'title_relevance': round(title_relevance, 3),
+                'similarity_score': similarity_score,
+                'experience_score': experience_score,
+                'location_score': location_score,
+                'skills_score': skills_score,
+                'title_relevance': title_relevance,
                 'final_score': round(final_score, 3),
                 'matched_skills': skills_analysis['matched_skills'],
                 'missing_skills': skills_analysis['missing_skills'],
                 'skill_match_percentage': round(skills_analysis['match_percentage'], 1)
-            }
-            
-            results.append(result)
+            })
         
         print(f"\n{'='*70}")
         print(f"✅ MATCHING COMPLETE")
@@ -501,8 +502,14 @@ class JobMatcher:
                        top_n: int = 10, min_score: float = 0.3, 
                        resume_skills: List[str] = None) -> List[Dict]:
         """Get top N job matches above minimum score"""
-        ranked_jobs = self.rank_jobs(jobs, resume_text, min_score, resume_skills=resume_skills)
-        return ranked_jobs[:top_n]
+        results = self.calculate_similarity_scores(jobs, resume_text, resume_skills)
+        
+        # Only the best top_n are needed, so skip sorting the whole list
+        return heapq.nlargest(
+            top_n,
+            (r for r in results if r['final_score'] >= min_score),
+            key=lambda x: x['final_score']
+        )
 
 
 def match_jobs_with_resume(jobs: List[Dict], resume_text: str, 
@@ -1,13 +1,12 @@
-import spacy
 import re
 from typing import Dict, Optional, List
 
-# Load spaCy model
 try:
-    nlp = spacy.load('en_core_web_sm')
-except:
-    print("⚠️ spaCy model not loaded")
-    nlp = None
+    from .keywords import KeywordScanner
+    from .linear_re import compile_linear
+except ImportError:
+    from keywords import KeywordScanner
+    from linear_re import compile_linear
 
 # COMPREHENSIVE technical skills list (matching resume_parser.py)
 KNOWN_TECHNICAL_SKILLS = {
@@ -66,14 +65,14 @@ KNOWN_TECHNICAL_SKILLS = {
 }
 
 # Noise words to exclude
-NON_SKILL_TERMS = {
+NON_SKILL_TERMS = frozenset({
     'the', 'and', 'or', 'in', 'at', 'by', 'for', 'with', 'to', 'from', 'using', 'used',
     'year', 'years', 'month', 'months', 'experience', 'role', 'team', 'based', 'etc',
     'including', 'other', 'various', 'well', 'work', 'worked', 'working', 'job', 'position',
     'company', 'project', 'projects', 'application', 'applications', 'system', 'systems',
     'strong', 'excellent', 'good', 'knowledge', 'skills', 'requirements', 'required',
     'preferred', 'must', 'should', 'ability', 'experience', 'developing', 'implementing'
-}
+})
 
 # Education qualifications
 EDUCATION = [
@@ -81,10 +80,48 @@ EDUCATION = [
     "b.e.", "m.e.", "b.s.", "m.s.", "doctorate", "bachelor", "master"
 ]
 
+# Regexes used on every job description, compiled once
+_WS_RE = re.compile(r'\s+')
+_BULLET_PATTERNS = [
+    re.compile(r'[•\-\*]\s*([A-Za-z0-9\s\.\+#/\-]+)', re.MULTILINE),  # Bullet points
+    re.compile(r'(?:^|\n)\s*[\d]+[\.\)]\s*([A-Za-z0-9\s\.\+#/\-]+)', re.MULTILINE),  # Numbered lists
+]
+_SKILL_SECTION_PATTERNS = [
+    re.compile(r'(?:required\s+skills?|technologies?|technical\s+skills?|tools?)\s*[:\-]?\s*(.{0,500}?)(?:\n\n|\n[A-Z]|$)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'(?:knowledge\s+of|experience\s+with|proficient\s+in)\s*[:\-]?\s*(.{0,300}?)(?:\.|,|\n|$)', re.IGNORECASE | re.DOTALL),
+]
+_COMMA_LIST_RE = re.compile(r'(?:skills?|technologies?|tools?|experience)\s*[:\-]?\s*([A-Za-z0-9\s\.,/\+#\-]+?)(?:\n|$)', re.MULTILINE)
+_VERSIONED_SKILL_RE = re.compile(r'\b([a-z]+)\s+[\d\.x]+\b')
+_COMPOUND_SKILL_RE = re.compile(r'\b([a-z]+)[/\-]([a-z]+)\b')
+# Joins extracted snippets so each skill is looked up once over all of them; no skill
+# contains it, so a match can never straddle two snippets
+_SNIPPET_SEP = '\x00'
+_LONG_SKILLS = [skill for skill in KNOWN_TECHNICAL_SKILLS if len(skill) > 3]
+_ABBREVIATION_RE = re.compile(r'\(([A-Z]+)\)')
+_TITLE_PATTERNS = [
+    re.compile(r'job\s+title\s*[:\-]\s*(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'^([A-Za-z\s/]+(?:engineer|developer|analyst|designer|manager|architect|scientist))', re.IGNORECASE | re.MULTILINE),
+]
+# Tried in priority order, so they stay separate rather than one alternation
+_EXPERIENCE_PATTERNS = [
+    compile_linear(r'(\d+[\+\-]?\s*(?:to|\-)?\s*\d*\s*years?\s+(?:of\s+)?(?:work\s+)?experience)'),
+    compile_linear(r'(?:minimum|min|at\s*least)\s*(\d+)\s*(?:\+)?\s*years?'),
+    compile_linear(r'experience\s*[:\-]\s*(\d+[\+\-]?\s*(?:to|\-)?\s*\d*\s*years?)'),
+]
+_LOCATION_PATTERNS = [
+    re.compile(r'location\s*[:\-]\s*([^\n]+?)(?:\n|$)', re.IGNORECASE),
+    re.compile(r'based\s+in\s+([^\n,]+)', re.IGNORECASE),
+    re.compile(r'city\s*[:\-]\s*([^\n]+?)(?:\n|$)', re.IGNORECASE),
+]
+_TRAILING_DASH_RE = re.compile(r'\s*[\-–]\s*$')
+# Known skills and degrees are each found in a single pass over the text
+_SKILL_SCANNER = KeywordScanner(KNOWN_TECHNICAL_SKILLS)
+_EDUCATION_SCANNER = KeywordScanner(EDUCATION)
+
 
 def clean_text(text: str) -> str:
     """Clean the input text"""
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     text = text.strip()
     return text
 
@@ -100,77 +137,47 @@ def extract_skills_from_jd(text: str) -> List[str]:
     print("\n🔍 Extracting skills from job description...")
     
     # 1. Direct matching with known skills (most reliable)
-    for skill in KNOWN_TECHNICAL_SKILLS:
-        # Create pattern with word boundaries
-        pattern = rf'\b{re.escape(skill)}\b'
-        if re.search(pattern, text_lower):
-            found_skills.add(skill)
+    found_skills.update(_SKILL_SCANNER.find(text_lower))
     
     print(f"   ✅ Found {len(found_skills)} skills from direct matching")
     
     # 2. Extract from bullet points and lists
     # LinkedIn often uses bullet points for skills
-    bullet_patterns = [
-        r'[•\-\*]\s*([A-Za-z0-9\s\.\+#/\-]+)',  # Bullet points
-        r'(?:^|\n)\s*[\d]+[\.\)]\s*([A-Za-z0-9\s\.\+#/\-]+)',  # Numbered lists
-    ]
-    
-    for pattern in bullet_patterns:
-        matches = re.finditer(pattern, text, re.MULTILINE)
-        for match in matches:
-            item = match.group(1).strip().lower()
-            # Check if item contains known skills
-            for skill in KNOWN_TECHNICAL_SKILLS:
-                if skill in item:
-                    found_skills.add(skill)
+    snippets = [match.group(1).strip().lower()
+                for pattern in _BULLET_PATTERNS for match in pattern.finditer(text)]
     
     # 3. Extract from skill sections
     # Look for sections like "Required Skills:", "Technologies:", etc.
-    skill_section_patterns = [
-        r'(?:required\s+skills?|technologies?|technical\s+skills?|tools?)\s*[:\-]?\s*(.{0,500}?)(?:\n\n|\n[A-Z]|$)',
-        r'(?:knowledge\s+of|experience\s+with|proficient\s+in)\s*[:\-]?\s*(.{0,300}?)(?:\.|,|\n|$)',
-    ]
-    
-    for pattern in skill_section_patterns:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE | re.DOTALL)
-        for match in matches:
-            section_text = match.group(1)
-            # Extract skills from this section
-            for skill in KNOWN_TECHNICAL_SKILLS:
-                if skill in section_text:
-                    found_skills.add(skill)
+    snippets.extend(match.group(1)
+                    for pattern in _SKILL_SECTION_PATTERNS for match in pattern.finditer(text_lower))
+    
+    # Any known skill contained in a bullet item or section
+    snippet_text = _SNIPPET_SEP.join(snippets)
+    found_skills.update(skill for skill in KNOWN_TECHNICAL_SKILLS if skill in snippet_text)
     
     # 4. Extract from comma-separated lists
     # LinkedIn often lists skills like "Python, Django, REST API"
-    comma_list_pattern = r'(?:skills?|technologies?|tools?|experience)\s*[:\-]?\s*([A-Za-z0-9\s\.,/\+#\-]+?)(?:\n|$)'
-    matches = re.finditer(comma_list_pattern, text_lower, re.MULTILINE)
-    
-    for match in matches:
-        items = match.group(1).split(',')
-        for item in items:
-            item_clean = item.strip()
-            # Check if this item is a known skill
-            for skill in KNOWN_TECHNICAL_SKILLS:
-                if skill == item_clean or (len(skill) > 3 and skill in item_clean):
-                    found_skills.add(skill)
+    items = [item.strip() for match in _COMMA_LIST_RE.finditer(text_lower)
+             for item in match.group(1).split(',')]
+    # An item that is a known skill, or contains a longer one
+    found_skills.update(item for item in items if item in KNOWN_TECHNICAL_SKILLS)
+    item_text = _SNIPPET_SEP.join(items)
+    found_skills.update(skill for skill in _LONG_SKILLS if skill in item_text)
     
     # 5. Extract version numbers (Python 3, Django 4.x, etc.)
-    version_pattern = r'\b([a-z]+)\s+[\d\.x]+\b'
-    for match in re.finditer(version_pattern, text_lower):
+    for match in _VERSIONED_SKILL_RE.finditer(text_lower):
         base_skill = match.group(1)
         if base_skill in KNOWN_TECHNICAL_SKILLS:
             found_skills.add(base_skill)
     
     # 6. Extract compound skills (e.g., "REST/SOAP API", "HTML5/CSS3")
-    compound_pattern = r'\b([a-z]+)[/\-]([a-z]+)\b'
-    for match in re.finditer(compound_pattern, text_lower):
+    for match in _COMPOUND_SKILL_RE.finditer(text_lower):
         for skill_part in match.groups():
             if skill_part in KNOWN_TECHNICAL_SKILLS:
                 found_skills.add(skill_part)
     
     # 7. Handle abbreviations in parentheses (e.g., "Application Programming Interface (API)")
-    abbrev_pattern = r'\(([A-Z]+)\)'
-    for match in re.finditer(abbrev_pattern, text):
+    for match in _ABBREVIATION_RE.finditer(text):
         abbrev = match.group(1).lower()
         if abbrev in KNOWN_TECHNICAL_SKILLS:
             found_skills.add(abbrev)
@@ -188,17 +195,12 @@ def extract_skills_from_jd(text: str) -> List[str]:
 def extract_job_title(text: str) -> str:
     """Extract job title from text"""
     # Look for common patterns
-    patterns = [
-        r'job\s+title\s*[:\-]\s*(.+?)(?:\n|$)',
-        r'^([A-Za-z\s/]+(?:engineer|developer|analyst|designer|manager|architect|scientist))',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.search(text)
         if match:
             title = match.group(1).strip()
             # Clean up
-            title = re.sub(r'\s+', ' ', title)
+            title = _WS_RE.sub(' ', title)
             return title
     
     # Fallback: First line if it looks like a title
@@ -211,14 +213,9 @@ def extract_job_title(text: str) -> str:
 
 def extract_experience(text: str) -> Optional[str]:
     """Extract experience requirements"""
-    patterns = [
-        r'(\d+[\+\-]?\s*(?:to|\-)?\s*\d*\s*years?\s+(?:of\s+)?(?:work\s+)?experience)',
-        r'(?:minimum|min|at\s*least)\s*(\d+)\s*(?:\+)?\s*years?',
-        r'experience\s*[:\-]\s*(\d+[\+\-]?\s*(?:to|\-)?\s*\d*\s*years?)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
+    text_lower = text.lower()
+    for pattern in _EXPERIENCE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return match.group(1).strip()
     
@@ -227,18 +224,12 @@ def extract_experience(text: str) -> Optional[str]:
 
 def extract_location(text: str) -> Optional[str]:
     """Extract location"""
-    patterns = [
-        r'location\s*[:\-]\s*([^\n]+?)(?:\n|$)',
-        r'based\s+in\s+([^\n,]+)',
-        r'city\s*[:\-]\s*([^\n]+?)(?:\n|$)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _LOCATION_PATTERNS:
+        match = pattern.search(text)
         if match:
             location = match.group(1).strip()
             # Clean up
-            location = re.sub(r'\s*[\-–]\s*$', '', location)
+            location = _TRAILING_DASH_RE.sub('', location)
             return location
     
     return None
@@ -246,14 +237,7 @@ def extract_location(text: str) -> Optional[str]:
 
 def extract_education(text: str) -> List[str]:
     """Extract education requirements"""
-    text_lower = text.lower()
-    found_education = set()
-    
-    for edu in EDUCATION:
-        if re.search(rf'\b{re.escape(edu)}\b', text_lower):
-            found_education.add(edu)
-    
-    return sorted(list(found_education))
+    return sorted(_EDUCATION_SCANNER.find(text.lower()))
 
 
 def parse_job_description(text: str) -> Dict:
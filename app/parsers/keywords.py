@@ -0,0 +1,80 @@
+import re
+from typing import Dict, Iterable, List, Set
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Regex matching any of words, factored by common prefix so each position is tried once"""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node: Dict) -> str:
+        is_end = '' in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: the longer keyword is tried first, the shorter one on backtrack
+        if is_end:
+            body = ('(?:' + body + ')?') if len(branches) == 1 else body + '?'
+        return body
+
+    return emit(trie)
+
+
+class KeywordScanner:
+    """
+    Finds which of a fixed set of keywords occur in a text in one regex pass.
+    Gives the same result as a separate word-boundary search for every keyword.
+    """
+    def __init__(self, keywords: Iterable[str], escape: bool = True):
+        """
+        Args:
+            keywords: Keywords to look for (matched case-sensitively, so pass lowercase text)
+            escape: If False the keywords are used as regex patterns instead of literals
+        """
+        self.keywords = sorted(set(keywords), key=len, reverse=True)
+        self.escape = escape
+
+        if escape:
+            # Literal keywords share one prefix trie; the matched text is the keyword
+            self._regex = re.compile(r'\b(?=(' + _trie_pattern(self.keywords) + r')\b)')
+            # Shorter keywords that also match where a longer one did ("react" in "react native")
+            self._also: Dict[str, List[str]] = {
+                kw: [other for other in self.keywords
+                     if len(other) < len(kw) and kw.startswith(other)
+                     and re.match(re.escape(other) + r'\b', kw)]
+                for kw in self.keywords
+            }
+        else:
+            # Patterns can't be merged into a trie: one group each, longest first
+            self._regex = re.compile(r'\b(?=(?:' + '|'.join(f'({kw})' for kw in self.keywords) + r')\b)')
+            self._later = [
+                [(other, re.compile(other + r'\b')) for other in self.keywords[i + 1:]]
+                for i in range(len(self.keywords))
+            ]
+
+    def find(self, text: str) -> Set[str]:
+        """Keywords present in text"""
+        found = set()
+        if self.escape:
+            # Lookahead match: the scan moves one word boundary at a time, so overlapping
+            # keywords are all seen
+            for match in self._regex.finditer(text):
+                keyword = match.group(1)
+                if keyword not in found:
+                    found.add(keyword)
+                    found.update(self._also[keyword])
+            return found
+
+        for match in self._regex.finditer(text):
+            i = match.lastindex - 1
+            found.add(self.keywords[i])
+            pos = match.start()
+            for other, pattern in self._later[i]:
+                if other not in found and pattern.match(text, pos):
+                    found.add(other)
+        return found
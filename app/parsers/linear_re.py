@@ -0,0 +1,27 @@
+import re
+
+try:
+    import re2
+    HAVE_RE2 = True
+except ImportError:
+    HAVE_RE2 = False
+
+# RE2's \s and \d are ASCII-only; these classes match what Python's re accepts on str
+_RE2_CLASSES = {
+    r'\s': r'[\s\v\x1c-\x1f\x85\pZ]',
+    r'\d': r'\p{Nd}',
+}
+
+
+def compile_linear(pattern: str):
+    """
+    Compile pattern with google-re2 when it is installed, otherwise with re.
+    RE2 runs in linear time (no backtracking), so it is both faster on long texts and
+    safe from pathological input. Patterns must stick to the syntax both engines share
+    (no lookarounds or backreferences) and must not use \\s or \\d inside [...].
+    """
+    if not HAVE_RE2:
+        return re.compile(pattern)
+    for escape, cls in _RE2_CLASSES.items():
+        pattern = pattern.replace(escape, cls)
+    return re2.compile(pattern)
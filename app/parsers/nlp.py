@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import List
+
+import spacy
+
+# Pipes named-entity recognition needs; everything else is skipped for NER-only calls
+NER_PIPES = ('tok2vec', 'ner')
+
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """
+    Shared spaCy pipeline, loaded once per process on first use.
+    Uses the large English model when installed, otherwise the small one.
+    """
+    try:
+        return spacy.load('en_core_web_lg')
+    except OSError:
+        return spacy.load('en_core_web_sm')
+
+
+@lru_cache(maxsize=None)
+def _non_ner_pipes() -> List[str]:
+    return [name for name in get_nlp().pipe_names if name not in NER_PIPES]
+
+
+def ner(text: str):
+    """Run only tok2vec + ner over text (no tagger, parser or lemmatizer)"""
+    return get_nlp()(text, disable=_non_ner_pipes())
@@ -1,16 +1,20 @@
 import os
-import spacy
-import pdfplumber
+import pymupdf
 import phonenumbers
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 
-# Load spaCy model
+# spaCy model is shared across parsers and loaded on first use
 try:
-    nlp = spacy.load('en_core_web_lg')
-except OSError:
-    nlp = spacy.load('en_core_web_sm')
+    from .nlp import ner
+    from .keywords import KeywordScanner
+    from .linear_re import compile_linear
+except ImportError:
+    from nlp import ner
+    from keywords import KeywordScanner
+    from linear_re import compile_linear
 
 # Skill normalization mapping
 SKILL_ALIASES = {
@@ -107,6 +111,61 @@ NOISE_WORDS = {
     'experienced', 'solid', 'strong', 'excellent', 'good', 'website', 'web', 'model', 'models'
 }
 
+# Only this many non-empty lines at the top are tried as a name header; later
+# title-case lines are more often addresses, cities or section headers
+NAME_HEADER_LINES = 2
+# Words that rule a title-case header line out as the candidate's name
+NAME_STOPWORDS = {
+    'resume', 'curriculum', 'vitae', 'cv', 'profile', 'summary', 'objective', 'contact',
+    'experience', 'education', 'skills', 'projects', 'work', 'professional', 'personal',
+    'engineer', 'developer', 'analyst', 'scientist', 'manager', 'designer', 'intern',
+    'consultant', 'architect', 'software', 'data', 'senior', 'junior', 'lead', 'student',
+    'university', 'college', 'institute', 'school', 'street', 'road', 'india', 'linkedin', 'github'
+}
+
+# Regexes used on every resume, compiled once
+_WS_RE = re.compile(r'\s+')
+# Digits or commas mean an address, date or contact line, never a name
+_NAME_REJECT_RE = re.compile(r'[\d,]')
+# A word of 2+ letters (any script), dots, apostrophes and hyphens; "J." counts
+_NAME_TOKEN_RE = re.compile(r"[^\W\d_](?:[^\W\d_]|[.'\-])+")
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}')
+_SKILLS_SECTION_PATTERNS = [
+    re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+        r'(?:technical\s+)?skills\s*:?\s*(.{0,800}?)(?:\n\n|education|experience|projects|certifications|$)',
+        r'(?:core\s+)?competencies\s*:?\s*(.{0,800}?)(?:\n\n|education|experience|projects|$)',
+        r'technologies\s*:?\s*(.{0,800}?)(?:\n\n|education|experience|projects|$)',
+    )
+]
+_SKILL_DELIMITER_RE = re.compile(r'[,;|•\n\t]|\sand\s|\sor\s')
+_BULLET_PREFIX_RE = re.compile(r'^[\d\.\-\*\•]+\s*')
+_USED_SKILLS_RE = re.compile(r'(?:using|used|with|including|proficient\s+in|experience\s+with|worked\s+with)\s+([a-z0-9\s\.\+#\-,;&]+?)(?:\.|,|\n|to\s|for\s|and\s+other)')
+_SKILL_LIST_SPLIT_RE = re.compile(r'[,;&]|\s+and\s+')
+_VERSIONED_SKILL_RE = re.compile(r'\b([a-z]+)\s+\d+(?:\.\d+)?\b')
+_FRAMEWORK_PATTERNS = [
+    re.compile(r'\b(react|angular|vue)(?:\s+js)?\b'),
+    re.compile(r'\b(express|django|flask|spring)(?:\s+boot)?\b'),
+    re.compile(r'\b(tensor|keras|pytorch|scikit)[\s\-]?(?:flow|learn)?\b'),
+]
+_SKILL_PREFIX_RE = re.compile(r'^(proficient\s+in|experience\s+with|knowledge\s+of)\s+')
+# Any one of these marks a string as technical (C++, C#, *.js, *sql, *db, *ml, JS/AI/ML)
+_TECHNICAL_INDICATOR_RE = re.compile('|'.join([
+    r'[a-z]+\+\+', r'[a-z]+#', r'[a-z]+\.js', r'[a-z]+sql',
+    r'[a-z]+db', r'[a-z]+ml', r'(?:^|\s)js(?:$|\s)',
+    r'(?:^|\s)ai(?:$|\s)', r'(?:^|\s)ml(?:$|\s)',
+]))
+# Known skills and degrees are each found in a single pass over the text
+_SKILL_SCANNER = KeywordScanner(KNOWN_TECHNICAL_SKILLS)
+_EDUCATION_SCANNER = KeywordScanner(EDUCATION, escape=False)
+# "5 years of experience" or "experience of 5 years", found in one scan
+_EXPERIENCE_YEARS_RE = compile_linear(
+    r'(\d+)\+?\s*(?:years|yrs|yr)(?:\s+of\s+)?(?:experience|work)'
+    r'|(?:experience|work)(?:\s+of\s+)?(\d+)\+?\s*(?:years|yrs|yr)'
+)
+# Processes for parse_resumes; each loads its own spaCy model, so never more than the CPUs
+BATCH_PARSE_WORKERS = min(os.cpu_count() or 1, 4)
+
 
 class ResumeParser:
     def __init__(self, resume_dir: str):
@@ -119,13 +178,15 @@ class ResumeParser:
         if not self.resume_dir.exists():
             raise FileNotFoundError(f"Directory not found: {resume_dir}")
 
-    def _extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract raw text from a PDF file"""
-        text = ""
+    def _extract_text_from_pdf(self, pdf_path: Path, data: Optional[bytes] = None) -> str:
+        """Extract raw text from a PDF file (or from its bytes, if already in memory)"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
+            if data is not None:
+                doc = pymupdf.open(stream=data, filetype="pdf")
+            else:
+                doc = pymupdf.open(pdf_path)
+            with doc:
+                text = "\n".join(page.get_text("text") for page in doc)
         except Exception as e:
             print(f"Error reading PDF {pdf_path.name}: {e}")
             return ""
@@ -133,67 +194,69 @@ class ResumeParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         text = text.strip().lower()
         return text
 
     def _extract_name(self, text: str) -> Optional[str]:
-        """Extract full name using spaCy NER"""
-        first_page = "\n".join(text.split("\n")[:5])
-        doc = nlp(first_page)
+        """Extract full name: a title-case header line if there is one, else spaCy NER"""
+        lines = text.split("\n", 10)[:10]
+        header = [line for line in lines if line.strip()][:NAME_HEADER_LINES]
+        for line in header:
+            if self._looks_like_name(line):
+                return _WS_RE.sub(' ', line.strip())
+
+        first_page = "\n".join(lines[:5])
+        doc = ner(first_page)
         
         for ent in doc.ents:
             if ent.label_ == "PERSON":
                 return ent.text.strip()
         return None
 
+    @staticmethod
+    def _looks_like_name(line: str) -> bool:
+        """2-4 capitalised words with no digits, commas, symbols or section/job-title words"""
+        if _NAME_REJECT_RE.search(line):
+            return False
+        words = line.split()
+        return (2 <= len(words) <= 4
+                and all(word[0].isupper() and _NAME_TOKEN_RE.fullmatch(word) for word in words)
+                and not any(word.lower().strip(".") in NAME_STOPWORDS for word in words))
+
     def _extract_email(self, text: str) -> Optional[str]:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        match = _EMAIL_RE.search(text)
         return match.group(0) if match else None
 
     def _extract_phone(self, text: str) -> Optional[str]:
-        """Extract phone number"""
-        pattern = r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}'
-        matches = re.finditer(pattern, text)
-        
-        for match in matches:
+        """Extract phone number (the first regex candidate phonenumbers accepts)"""
+        for match in _PHONE_RE.finditer(text):
             try:
                 number = phonenumbers.parse(match.group(), "US")
-                if phonenumbers.is_valid_number(number):
-                    return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
-            except:
+            except phonenumbers.NumberParseException:
                 continue
+            if phonenumbers.is_valid_number(number):
+                return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
         return None
 
-    def _extract_skills(self, text: str) -> Dict[str, List[str]]:
-        """Extract skills using IMPROVED pattern matching"""
-        text_lower = self._clean_text(text)
+    def _extract_skills(self, text_lower: str) -> Dict[str, List[str]]:
+        """Extract skills using IMPROVED pattern matching (from _clean_text output)"""
         technical_skills = set()
         
         print("\n🔍 Starting skill extraction...")
-        print(f"   Text length: {len(text)} characters")
+        print(f"   Text length: {len(text_lower)} characters")
         
         # 1. Extract ALL known skills directly (more aggressive)
-        for skill in KNOWN_TECHNICAL_SKILLS:
-            pattern = rf'\b{re.escape(skill)}\b'
-            if re.search(pattern, text_lower):
-                technical_skills.add(skill)
+        technical_skills.update(_SKILL_SCANNER.find(text_lower))
         
         print(f"   ✅ Found {len(technical_skills)} skills from direct matching")
         
         # 2. Extract from Skills section specifically
-        skills_section_patterns = [
-            r'(?:technical\s+)?skills\s*:?\s*(.{0,800}?)(?:\n\n|education|experience|projects|certifications|$)',
-            r'(?:core\s+)?competencies\s*:?\s*(.{0,800}?)(?:\n\n|education|experience|projects|$)',
-            r'technologies\s*:?\s*(.{0,800}?)(?:\n\n|education|experience|projects|$)',
-        ]
-        
         skills_section_text = ""
-        for pattern in skills_section_patterns:
+        for pattern in _SKILLS_SECTION_PATTERNS:
             try:
-                match = re.search(pattern, text_lower, re.IGNORECASE | re.DOTALL)
+                match = pattern.search(text_lower)
                 if match:
                     skills_section_text = match.group(1)
                     print(f"   📋 Found skills section ({len(skills_section_text)} chars)")
@@ -204,16 +267,15 @@ class ResumeParser:
         
         # 3. Parse skills section
         if skills_section_text:
-            delimiters = r'[,;|•\n\t]|\sand\s|\sor\s'
             try:
-                skill_candidates = re.split(delimiters, skills_section_text)
+                skill_candidates = _SKILL_DELIMITER_RE.split(skills_section_text)
             except Exception:
                 skill_candidates = []
             
             for candidate in skill_candidates:
                 try:
                     candidate = candidate.strip()
-                    candidate = re.sub(r'^[\d\.\-\*\•]+\s*', '', candidate)
+                    candidate = _BULLET_PREFIX_RE.sub('', candidate)
                     candidate = candidate.strip()
                     
                     if len(candidate) < 2 or len(candidate) > 40:
@@ -230,12 +292,10 @@ class ResumeParser:
                     continue
         
         # 4. Look for skills in experience descriptions
-        experience_pattern = r'(?:using|used|with|including|proficient\s+in|experience\s+with|worked\s+with)\s+([a-z0-9\s\.\+#\-,;&]+?)(?:\.|,|\n|to\s|for\s|and\s+other)'
-        
         try:
-            for match in re.finditer(experience_pattern, text_lower):
+            for match in _USED_SKILLS_RE.finditer(text_lower):
                 skills_str = match.group(1).strip()
-                for skill in re.split(r'[,;&]|\s+and\s+', skills_str):
+                for skill in _SKILL_LIST_SPLIT_RE.split(skills_str):
                     skill = skill.strip()
                     if self._is_valid_skill(skill):
                         normalized = self._normalize_skill(skill)
@@ -244,9 +304,8 @@ class ResumeParser:
             print(f"   ⚠️  Error in experience pattern: {e}")
         
         # 5. Check for version numbers
-        version_pattern = r'\b([a-z]+)\s+\d+(?:\.\d+)?\b'
         try:
-            for match in re.finditer(version_pattern, text_lower):
+            for match in _VERSIONED_SKILL_RE.finditer(text_lower):
                 base_skill = match.group(1)
                 if base_skill in KNOWN_TECHNICAL_SKILLS:
                     technical_skills.add(base_skill)
@@ -254,15 +313,9 @@ class ResumeParser:
             print(f"   ⚠️  Error in version pattern: {e}")
         
         # 6. Look for framework/library patterns
-        framework_patterns = [
-            r'\b(react|angular|vue)(?:\s+js)?\b',
-            r'\b(express|django|flask|spring)(?:\s+boot)?\b',
-            r'\b(tensor|keras|pytorch|scikit)[\s\-]?(?:flow|learn)?\b',
-        ]
-        
-        for pattern in framework_patterns:
+        for pattern in _FRAMEWORK_PATTERNS:
             try:
-                for match in re.finditer(pattern, text_lower):
+                for match in pattern.finditer(text_lower):
                     skill = match.group(0).strip()
                     if self._is_valid_skill(skill):
                         technical_skills.add(skill)
@@ -285,7 +338,7 @@ class ResumeParser:
         """Check if a string is a valid technical skill"""
         try:
             skill = skill.lower().strip()
-            skill = re.sub(r'^(proficient\s+in|experience\s+with|knowledge\s+of)\s+', '', skill)
+            skill = _SKILL_PREFIX_RE.sub('', skill)
             skill = skill.strip()
             
             if len(skill) < 2 or len(skill) > 35:
@@ -314,15 +367,8 @@ class ResumeParser:
             if len(words) > 0 and all(w in NOISE_WORDS for w in words):
                 return False
             
-            technical_indicators = [
-                r'[a-z]+\+\+', r'[a-z]+#', r'[a-z]+\.js', r'[a-z]+sql',
-                r'[a-z]+db', r'[a-z]+ml', r'(?:^|\s)js(?:$|\s)',
-                r'(?:^|\s)ai(?:$|\s)', r'(?:^|\s)ml(?:$|\s)',
-            ]
-            
-            for pattern in technical_indicators:
-                if re.search(pattern, skill):
-                    return True
+            if _TECHNICAL_INDICATOR_RE.search(skill):
+                return True
             
             if len(words) >= 2:
                 for word in words:
@@ -344,50 +390,37 @@ class ResumeParser:
         
         return skill
 
-    def _extract_education(self, text: str) -> List[str]:
-        """Extract education qualifications"""
-        text = self._clean_text(text)
-        found_education = set()
-        
-        for edu in EDUCATION:
-            if re.search(rf'\b{edu}\b', text):
-                found_education.add(edu)
-        
-        return sorted(list(found_education))
+    def _extract_education(self, text_lower: str) -> List[str]:
+        """Extract education qualifications (from _clean_text output)"""
+        return sorted(_EDUCATION_SCANNER.find(text_lower))
 
-    def _extract_experience_years(self, text: str) -> Optional[int]:
-        """Extract total years of experience"""
-        experience_patterns = [
-            r'(\d+)\+?\s*(?:years|yrs|yr)(?:\s+of\s+)?(?:experience|work)',
-            r'(?:experience|work)(?:\s+of\s+)?(\d+)\+?\s*(?:years|yrs|yr)',
-        ]
-        
+    def _extract_experience_years(self, text_lower: str) -> Optional[int]:
+        """Extract total years of experience (from lowercased text)"""
         max_years = 0
-        for pattern in experience_patterns:
-            matches = re.finditer(pattern, text.lower())
-            for match in matches:
-                try:
-                    years = int(match.group(1))
-                    max_years = max(max_years, years)
-                except:
-                    continue
+        for match in _EXPERIENCE_YEARS_RE.finditer(text_lower):
+            max_years = max(max_years, int(match.group(1) or match.group(2)))
         
         return max_years if max_years > 0 else None
 
-    def parse_resume(self, file_name: str) -> Dict[str, Union[str, List[str], int, None]]:
-        """Parse a single resume and extract information"""
+    def parse_resume(self, file_name: str, data: Optional[bytes] = None) -> Dict[str, Union[str, List[str], int, None]]:
+        """
+        Parse a single resume and extract information.
+        Pass the PDF bytes as `data` when the caller already has them to skip re-reading the file.
+        """
         pdf_path = self.resume_dir / file_name
-        if not pdf_path.exists():
+        if data is None and not pdf_path.exists():
             return {"error": f"File not found: {file_name}"}
 
-        text = self._extract_text_from_pdf(pdf_path)
+        text = self._extract_text_from_pdf(pdf_path, data)
         if not text:
             return {"error": f"Could not extract text from {file_name}"}
             
         print(f"\nProcessing resume: {file_name}")
         print("Extracted text length:", len(text))
 
-        skills_dict = self._extract_skills(text)
+        # Normalised once; the keyword extractors all work on this copy
+        text_lower = self._clean_text(text)
+        skills_dict = self._extract_skills(text_lower)
         
         return {
             'file_name': file_name,
@@ -396,17 +429,25 @@ class ResumeParser:
             'phone': self._extract_phone(text),
             'technical_skills': skills_dict['technical'],
             'soft_skills': skills_dict['soft'],
-            'education': self._extract_education(text),
-            'years_of_experience': self._extract_experience_years(text)
+            'education': self._extract_education(text_lower),
+            'years_of_experience': self._extract_experience_years(text_lower)
         }
 
     def parse_resumes(self) -> List[Dict]:
-        """Parse all PDF resumes in the specified directory"""
-        results = []
-        for pdf_file in self.resume_dir.glob('*.pdf'):
-            result = self.parse_resume(pdf_file.name)
-            results.append(result)
-        return results
+        """Parse all PDF resumes in the specified directory (in parallel when there are several)"""
+        file_names = [pdf_file.name for pdf_file in self.resume_dir.glob('*.pdf')]
+        if len(file_names) <= 1:
+            return [self.parse_resume(name) for name in file_names]
+
+        workers = min(BATCH_PARSE_WORKERS, len(file_names))
+        resume_dirs = [str(self.resume_dir)] * len(file_names)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_parse_one, resume_dirs, file_names))
+
+
+def _parse_one(resume_dir: str, file_name: str) -> Dict:
+    """Process pool entry point: module-level so it pickles"""
+    return ResumeParser(resume_dir).parse_resume(file_name)
 
 
 def parse_resume_file(file_path: str) -> Dict:
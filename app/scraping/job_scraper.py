@@ -1,9 +1,17 @@
 import time
 import os
+import random
 import tempfile
 import uuid
 import shutil
-from typing import List, Dict, Optional
+import itertools
+import hashlib
+import threading
+import logging
+from multiprocessing import Pool
+import selenium
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -13,6 +21,86 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from bs4 import BeautifulSoup
 import re
 
+logger = logging.getLogger(__name__)
+
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAVE_BLOOM = True
+except ImportError:
+    HAVE_BLOOM = False
+
+try:
+    import diskcache
+    HAVE_DISKCACHE = True
+except ImportError:
+    HAVE_DISKCACHE = False
+
+# Concurrent WebDriver/CDP commands each need their own keep-alive socket;
+# Selenium's default urllib3 pool holds a single connection.
+DRIVER_POOL_MAXSIZE = 20
+
+# Selenium 4.26+ takes the pool size through the public ClientConfig
+SELENIUM_VERSION = tuple(int(part) for part in re.findall(r'\d+', selenium.__version__)[:2])
+HAVE_CLIENT_CONFIG = SELENIUM_VERSION >= (4, 26)
+if HAVE_CLIENT_CONFIG:
+    from selenium.webdriver.remote.client_config import ClientConfig
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+# Result pages after the first are opened in background tabs up front so Chrome
+# loads them concurrently; opens are spaced out to stay clear of rate limits.
+TAB_OPEN_DELAY = (1.0, 2.0)
+
+# Company node candidates, most reliable first (subtitle, primary description, company links)
+_COMPANY_SELECTORS = (
+    'h4[class*="base-search-card__subtitle"]',
+    'a[class*="job-card-container__primary-description"]',
+    'a[class*="hidden-nested-link"]',
+    'a[href*="/company/"]',
+)
+_COMPANY_NOISE = re.compile(
+    r'\d+\s*employee.*|\d+\s*connection.*|\d+\s*follower.*|Posted\s+\d+.*|Reposted\s+\d+.*',
+    re.IGNORECASE
+)
+# Footer nodes that carry the "Easy Apply" label on a job card
+_EASY_APPLY_SEL = (
+    'li[class*="job-card-container__apply-method"], '
+    'span[class*="job-card-container__footer-item"], '
+    'li[class*="job-card-container__footer-item"]'
+)
+_LOGO_SUFFIX = re.compile(r'\s+logo$', re.IGNORECASE)
+_TIME_AGO = re.compile(r'\d+\s*(hour|day|week)', re.IGNORECASE)
+
+# Job detail pages, keyed by a hash of the canonical job URL (shared by all processes on this machine)
+DETAIL_CACHE_DIR = os.environ.get('JOBLANCER_DETAIL_CACHE_DIR', os.path.expanduser('~/.joblancer_cache'))
+DETAIL_CACHE_TTL = 24 * 60 * 60
+_JOB_VIEW_ID = re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)')
+
+_detail_cache = None
+_detail_cache_lock = threading.Lock()
+
+
+def _get_detail_cache():
+    """Open the job detail cache on first use (None without diskcache)"""
+    global _detail_cache
+    if not HAVE_DISKCACHE:
+        return None
+    if _detail_cache is None:
+        with _detail_cache_lock:
+            if _detail_cache is None:
+                _detail_cache = diskcache.Cache(DETAIL_CACHE_DIR)
+    return _detail_cache
+
+
+def _detail_cache_key(job: Dict) -> str:
+    """Cache key for a job page: hash of its canonical URL, ignoring slug and tracking params"""
+    link = job['link']
+    match = _JOB_VIEW_ID.search(link)
+    if match:
+        url = f"https://www.linkedin.com/jobs/view/{match.group(1)}"
+    else:
+        url = link.split('#')[0].split('?')[0].rstrip('/')
+    return 'jobview:' + hashlib.sha256(url.encode('utf-8')).hexdigest()
+
 
 class JobScraperSession:
     """
@@ -23,6 +111,9 @@ class JobScraperSession:
         self.driver = None
         self.temp_profile_dir = None
         self.is_logged_in = False
+        # True only once the last search ran through every page without an error
+        self.last_search_complete = False
+        self._search_errors = 0
         
     def __enter__(self):
         self.initialize_driver()
@@ -80,6 +171,7 @@ class JobScraperSession:
             for attempt in range(max_retries):
                 try:
                     self.driver = webdriver.Chrome(options=options)
+                    self._widen_connection_pool()
                     self.driver.set_page_load_timeout(30)
                     self.driver.implicitly_wait(3)
                     
@@ -114,6 +206,48 @@ class JobScraperSession:
             raise
         
         print("="*60 + "\n")
+    
+    def _widen_connection_pool(self, maxsize: int = DRIVER_POOL_MAXSIZE):
+        """Raise the command executor's urllib3 pool size so overlapping commands don't serialize"""
+        executor = self.driver.command_executor
+        
+        if HAVE_CLIENT_CONFIG:
+            # Swap in a connection created with the wider pool, talking to the same chromedriver
+            try:
+                config = executor.client_config
+                self.driver.command_executor = ChromiumRemoteConnection(
+                    remote_server_addr=config.remote_server_addr,
+                    vendor_prefix="goog",
+                    browser_name="chrome",
+                    client_config=ClientConfig(
+                        remote_server_addr=config.remote_server_addr,
+                        keep_alive=config.keep_alive,
+                        timeout=config.timeout,
+                        # Selenium reads the PoolManager kwargs from this nested key
+                        init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": maxsize}},
+                    ),
+                )
+                executor.close()
+            except Exception as e:
+                logger.warning("⚠️ Could not resize connection pool: %s", e)
+            return
+        
+        # Older Selenium has no way to size the pool, so rebuild its private PoolManager
+        logger.info("Selenium %s predates ClientConfig; resizing the driver's private connection pool",
+                    selenium.__version__)
+        conn = getattr(executor, '_conn', None)
+        
+        # Only rebuild a plain PoolManager; proxy managers carry extra state
+        if conn is None or type(conn).__name__ != 'PoolManager':
+            return
+        
+        try:
+            pool_kwargs = dict(conn.connection_pool_kw)
+            pool_kwargs['maxsize'] = maxsize
+            executor._conn = type(conn)(**pool_kwargs)
+            conn.clear()
+        except Exception as e:
+            logger.warning("⚠️ Could not resize connection pool: %s", e)
         
     def login_to_linkedin(self, wait_for_manual_login: bool = True):
         """Navigate to LinkedIn and wait for user to log in manually"""
@@ -179,8 +313,32 @@ class JobScraperSession:
         
         print("="*60 + "\n")
     
+    def export_cookies(self) -> List[Dict]:
+        """Return the cookies of the current (logged-in) browser session"""
+        if not self.driver:
+            raise RuntimeError("Driver not initialized")
+        return self.driver.get_cookies()
+    
+    def load_cookies(self, cookies: List[Dict]):
+        """Restore cookies exported from another session so it skips manual login"""
+        if not self.driver:
+            raise RuntimeError("Driver not initialized")
+        
+        # Cookies can only be set for the domain currently loaded
+        if "linkedin.com" not in self.driver.current_url:
+            self.driver.get("https://www.linkedin.com/login")
+        
+        loaded = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                loaded += 1
+            except Exception:
+                continue
+        logger.info("🍪 Loaded %d/%d cookies", loaded, len(cookies))
+    
     def search_jobs(self, query: str, location: str = "", num_pages: int = 1, 
-                   fetch_details: bool = False) -> List[Dict]:
+                   fetch_details: bool = False, ignore_cache: bool = False) -> List[Dict]:
         """
         Search for jobs on LinkedIn
         
@@ -189,24 +347,36 @@ class JobScraperSession:
             location: Job location (optional)
             num_pages: Number of pages to scrape
             fetch_details: If True, fetches full job description (slower but more accurate)
+            ignore_cache: If True, re-fetches job pages even if they are cached on disk
             
         Returns:
             List of job dictionaries
         """
-        print("\n" + "="*60)
-        print("🔎 SEARCHING FOR JOBS ON LINKEDIN")
-        print("="*60)
-        print(f"Query: {query}")
-        print(f"Location: {location if location else 'Any'}")
-        print(f"Pages: {num_pages}")
-        print(f"Details Mode: {'ON (slower, more accurate)' if fetch_details else 'OFF (fast)'}")
-        print("="*60 + "\n")
+        all_jobs = [job for page_jobs in self.iter_search_jobs(query, location, num_pages,
+                                                               fetch_details, ignore_cache)
+                    for job in page_jobs]
+        
+        logger.info("✅ SCRAPING COMPLETE - %d jobs", len(all_jobs))
+        
+        return all_jobs
+    
+    def iter_search_jobs(self, query: str, location: str = "", num_pages: int = 1,
+                         fetch_details: bool = False, ignore_cache: bool = False) -> Iterator[List[Dict]]:
+        """
+        Same search as search_jobs, but yields each page's jobs as soon as they
+        are ready so callers can start processing before the last page loads
+        """
+        logger.info("🔎 SEARCHING FOR JOBS ON LINKEDIN")
+        logger.info("Query: %s | Location: %s | Pages: %d | Details Mode: %s",
+                    query, location or 'Any', num_pages,
+                    'ON (slower, more accurate)' if fetch_details else 'OFF (fast)')
         
         if not self.driver:
             raise RuntimeError("Driver not initialized")
         
-        all_jobs = []
-        seen_job_ids = set()
+        seen_job_ids = _new_seen_ids()
+        self.last_search_complete = False
+        self._search_errors = 0
         
         # Build LinkedIn search URL with Easy Apply filter
         base_url = "https://www.linkedin.com/jobs/search/?"
@@ -219,57 +389,126 @@ class JobScraperSession:
         params.append("f_AL=true")  # Easy Apply filter
         
         search_url = base_url + "&".join(params)
+        page_urls = [f"{search_url}&start={page * 25}" for page in range(num_pages)]
+        
+        main_window = self.driver.current_window_handle
+        tabs = self._open_page_tabs(page_urls[1:], start_page=1)
         
-        for page in range(num_pages):
+        # Page N is parsed on a worker thread while the driver reads page N+1.
+        # Everything that touches the driver stays on this thread; a single
+        # parser thread keeps pages (and seen_job_ids) in order.
+        # Tabs only let Chrome load pages concurrently; they are read one at a time.
+        try:
+            with ThreadPoolExecutor(max_workers=1) as parser:
+                pending = None
+                for page in range(num_pages):
+                    page_source = None
+                    tab = tabs.pop(page, None)
+                    try:
+                        logger.info("📄 Page %d/%d", page + 1, num_pages)
+                        
+                        if tab:
+                            # Already loading (or loaded) in its own tab
+                            self.driver.switch_to.window(tab)
+                        else:
+                            self.driver.get(page_urls[page])
+                            time.sleep(3)
+                        
+                        try:
+                            WebDriverWait(self.driver, 8).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list, div.job-card-container"))
+                            )
+                        except TimeoutException:
+                            logger.warning("⚠️  Timeout waiting for jobs")
+                        
+                        # Quick scroll
+                        for _ in range(2):
+                            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                            time.sleep(0.5)
+                        
+                        page_source = self.driver.page_source
+                    except Exception as e:
+                        logger.warning("❌ Error on page %d: %s", page + 1, e)
+                        self._search_errors += 1
+                    finally:
+                        # Detail fetching and the next page go through the main window
+                        if tab:
+                            self._close_tabs([tab], main_window)
+                    
+                    if pending is not None:
+                        yield self._collect_page(*pending, fetch_details, ignore_cache)
+                        pending = None
+                    if page_source is not None:
+                        pending = (page, parser.submit(self._parse_page_source, page_source, seen_job_ids))
+                
+                if pending is not None:
+                    yield self._collect_page(*pending, fetch_details, ignore_cache)
+            
+            self.last_search_complete = self._search_errors == 0
+        finally:
+            # Tabs left over if the caller stopped early
+            if tabs:
+                self._close_tabs(list(tabs.values()), main_window)
+    
+    def _open_page_tabs(self, urls: List[str], start_page: int) -> Dict[int, str]:
+        """
+        Start loading urls in background tabs; returns {page index: window handle}.
+        Pages whose tab could not be opened are simply missing and load in the main window.
+        """
+        tabs = {}
+        for offset, url in enumerate(urls):
             try:
-                print(f"\n📄 Page {page + 1}/{num_pages}")
-                
-                page_url = f"{search_url}&start={page * 25}"
-                print(f"🌐 Loading jobs...")
-                self.driver.get(page_url)
-                time.sleep(3)
-                
-                try:
-                    WebDriverWait(self.driver, 8).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list, div.job-card-container"))
-                    )
-                except TimeoutException:
-                    print("⚠️  Timeout waiting for jobs")
-                
-                # Quick scroll
-                for _ in range(2):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(0.5)
-                
-                # Parse with BeautifulSoup (fast)
-                print("⚡ Parsing job listings...")
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                page_jobs = self._parse_jobs_with_beautifulsoup(soup, seen_job_ids)
-                
-                # Optionally fetch detailed info
-                if fetch_details and page_jobs:
-                    print(f"📋 Fetching details for {len(page_jobs)} jobs...")
-                    page_jobs = self._enrich_jobs_with_details(page_jobs)
-                
-                all_jobs.extend(page_jobs)
-                
-                print(f"✅ Collected {len(page_jobs)} jobs from this page")
-                print(f"📊 Total: {len(all_jobs)} jobs")
-                
+                before = set(self.driver.window_handles)
+                self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+                opened = [handle for handle in self.driver.window_handles if handle not in before]
             except Exception as e:
-                print(f"❌ Error on page {page + 1}: {str(e)}")
+                logger.warning("⚠️  Could not open page %d in a tab: %s", start_page + offset + 1, e)
+                break
+            if not opened:
+                break
+            tabs[start_page + offset] = opened[0]
+            if offset + 1 < len(urls):
+                time.sleep(random.uniform(*TAB_OPEN_DELAY))
+        return tabs
+    
+    def _close_tabs(self, handles: List[str], main_window: str):
+        """Close the given tabs and return to the main window"""
+        for handle in handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
                 continue
-        
-        print("\n" + "="*60)
-        print("✅ SCRAPING COMPLETE")
-        print(f"📈 Total: {len(all_jobs)} jobs")
-        print("="*60 + "\n")
-        
-        return all_jobs
+        try:
+            self.driver.switch_to.window(main_window)
+        except Exception as e:
+            logger.warning("⚠️  Could not return to the main window: %s", e)
+    
+    def _parse_page_source(self, page_source: str, seen_ids) -> List[Dict]:
+        """Parse one search results page (runs on the parser thread)"""
+        # Parse with BeautifulSoup on the C lxml parser (fast)
+        soup = BeautifulSoup(page_source, 'lxml')
+        return self._parse_jobs_with_beautifulsoup(soup, seen_ids)
+    
+    def _collect_page(self, page: int, parsed, fetch_details: bool, ignore_cache: bool) -> List[Dict]:
+        """Wait for a page's parsed jobs and optionally enrich them"""
+        try:
+            page_jobs = parsed.result()
+            
+            # Optionally fetch detailed info
+            if fetch_details and page_jobs:
+                logger.info("📋 Fetching details for %d jobs...", len(page_jobs))
+                page_jobs = self._enrich_jobs_with_details(page_jobs, ignore_cache)
+            
+            logger.info("✅ Collected %d jobs from page %d", len(page_jobs), page + 1)
+            return page_jobs
+            
+        except Exception as e:
+            logger.warning("❌ Error on page %d: %s", page + 1, e)
+            self._search_errors += 1
+            return []
     
-    def _parse_jobs_with_beautifulsoup(self, soup: BeautifulSoup, seen_ids: set) -> List[Dict]:
+    def _parse_jobs_with_beautifulsoup(self, soup: BeautifulSoup, seen_ids) -> List[Dict]:
         """Parse all jobs from page HTML using BeautifulSoup - FIXED COMPANY EXTRACTION"""
         jobs = []
         
@@ -280,19 +519,22 @@ class JobScraperSession:
         if not job_cards:
             job_cards = soup.find_all(['li', 'div'], attrs={'data-occludable-job-id': True})
         
-        print(f"  Found {len(job_cards)} job cards on page")
+        logger.debug("  Found %d job cards on page", len(job_cards))
         
         for idx, card in enumerate(job_cards, 1):
             try:
-                # Check for Easy Apply
-                card_text = card.get_text().lower()
-                is_easy_apply = 'easy apply' in card_text
+                # Check for Easy Apply (only the footer labels, not the whole card text)
+                is_easy_apply = any(
+                    'easy apply' in label.get_text().lower()
+                    for label in card.select(_EASY_APPLY_SEL)
+                )
                 
                 # Extract job ID
+                attrs = card.attrs
                 job_id = (
-                    card.get('data-occludable-job-id') or 
-                    card.get('data-job-id') or
-                    card.get('data-id')
+                    attrs.get('data-occludable-job-id') or 
+                    attrs.get('data-job-id') or
+                    attrs.get('data-id')
                 )
                 
                 if job_id and job_id in seen_ids:
@@ -328,115 +570,7 @@ class JobScraperSession:
                     continue
                 
                 # ==================== FIXED COMPANY EXTRACTION ====================
-                company = None
-                
-                # STRATEGY 1: Primary subtitle (most reliable for current LinkedIn)
-                company_elem = card.find('h4', class_=lambda x: x and 'base-search-card__subtitle' in x)
-                if company_elem:
-                    company_text = company_elem.get_text().strip()
-                    company_text = re.sub(r'\s+', ' ', company_text)
-                    
-                    # Clean up - remove location if it's in same element (format: "Company • Location")
-                    if '•' in company_text:
-                        parts = [p.strip() for p in company_text.split('•')]
-                        company = parts[0] if parts[0] else None
-                    else:
-                        company = company_text
-                
-                # STRATEGY 2: Company link with specific class
-                if not company or len(company) < 2:
-                    company_link = card.find('a', class_=lambda x: x and 'job-card-container__primary-description' in x)
-                    if company_link:
-                        company = company_link.get_text().strip()
-                
-                # STRATEGY 3: Look for company links (multiple patterns)
-                if not company or len(company) < 2:
-                    company_link_selectors = [
-                        ('a', lambda x: x and 'hidden-nested-link' in x),
-                        ('a', lambda x: x and '/company/' in str(x)),
-                    ]
-                    
-                    for tag, class_filter in company_link_selectors:
-                        links = card.find_all(tag, class_=class_filter) if callable(class_filter) else card.find_all(tag, href=lambda x: '/company/' in str(x))
-                        
-                        for link in links:
-                            # Check aria-label (very reliable)
-                            aria_label = link.get('aria-label', '')
-                            if aria_label:
-                                # Remove "logo" suffix if present
-                                company_candidate = re.sub(r'\s+logo$', '', aria_label, flags=re.IGNORECASE).strip()
-                                if len(company_candidate) > 2 and not re.search(r'\d+\s*(hour|day|week)', company_candidate, re.IGNORECASE):
-                                    company = company_candidate
-                                    break
-                            
-                            # Check link text
-                            link_text = link.get_text().strip()
-                            link_text = re.sub(r'\s+', ' ', link_text)
-                            if len(link_text) > 2 and not re.search(r'\d+\s*(hour|day|week)', link_text, re.IGNORECASE):
-                                company = link_text
-                                break
-                        
-                        if company and len(company) > 2:
-                            break
-                
-                # STRATEGY 4: Extract from data attributes
-                if not company or len(company) < 2:
-                    # Check for entity-urn which often contains company info
-                    for link in card.find_all('a', href=lambda x: x and '/company/' in str(x)):
-                        href = link.get('href', '')
-                        # Extract company name from URL path
-                        match = re.search(r'/company/([^/?]+)', href)
-                        if match:
-                            company_slug = match.group(1)
-                            # Convert slug to readable name (e.g., "microsoft-corporation" -> "Microsoft Corporation")
-                            company = company_slug.replace('-', ' ').title()
-                            break
-                
-                # STRATEGY 5: Look in parent containers
-                if not company or len(company) < 2:
-                    # Find the info section
-                    info_section = card.find('div', class_=lambda x: x and 'base-search-card__info' in x)
-                    if info_section:
-                        # Get all h4 elements
-                        h4_elements = info_section.find_all('h4')
-                        # First h4 after title is usually company
-                        if len(h4_elements) >= 1:
-                            company_text = h4_elements[0].get_text().strip()
-                            company_text = re.sub(r'\s+', ' ', company_text)
-                            
-                            # Validate it's not location or time
-                            if (company_text and len(company_text) > 2 and
-                                not re.search(r'\d+\s*(hour|day|week|month)', company_text, re.IGNORECASE) and
-                                not re.search(r'(remote|hybrid|on-site)', company_text, re.IGNORECASE)):
-                                company = company_text
-                
-                # STRATEGY 6: Fallback - look for any text between title and location
-                if not company or len(company) < 2:
-                    # Get all text nodes and find company by position
-                    all_text_elements = card.find_all(['h3', 'h4', 'span', 'div'])
-                    found_title = False
-                    
-                    for elem in all_text_elements:
-                        text = elem.get_text().strip()
-                        text = re.sub(r'\s+', ' ', text)
-                        
-                        if not text or len(text) < 2:
-                            continue
-                        
-                        # Skip if it's the title
-                        if title and text in title:
-                            found_title = True
-                            continue
-                        
-                        # After finding title, next valid text is likely company
-                        if found_title:
-                            # Validate it's not noise
-                            if (not re.search(r'\d+\s*(hour|day|week|month|minute)', text, re.IGNORECASE) and
-                                not re.search(r'^(remote|hybrid|on-site)$', text, re.IGNORECASE) and
-                                not re.search(r'^\d+$', text) and
-                                '•' not in text):
-                                company = text
-                                break
+                company = self._extract_company(card, title)
                 
                 # Final cleanup
                 if company:
@@ -444,16 +578,7 @@ class JobScraperSession:
                     company = re.sub(r'\s+', ' ', company).strip()
                     
                     # Remove noise patterns
-                    noise_patterns = [
-                        r'\d+\s*employee.*',
-                        r'\d+\s*connection.*',
-                        r'\d+\s*follower.*',
-                        r'Posted\s+\d+.*',
-                        r'Reposted\s+\d+.*',
-                    ]
-                    
-                    for pattern in noise_patterns:
-                        company = re.sub(pattern, '', company, flags=re.IGNORECASE).strip()
+                    company = _COMPANY_NOISE.sub('', company).strip()
                     
                     # Remove separators at the end
                     company = re.sub(r'[•·|]+$', '', company).strip()
@@ -489,7 +614,7 @@ class JobScraperSession:
                 link = None
                 link_elem = card.find('a', href=lambda x: x and '/jobs/view/' in x)
                 if link_elem:
-                    href = link_elem.get('href')
+                    href = link_elem.attrs.get('href')
                     if href:
                         link = href if href.startswith('http') else f"https://www.linkedin.com{href}"
                         if '?' in link:
@@ -519,53 +644,146 @@ class JobScraperSession:
                     seen_ids.add(job_id)
                 
                 # Debug output
-                if idx <= 3:
-                    print(f"    Job {idx}: {title[:35]} | {company[:25]} | {location[:20]}")
+                if idx <= 3 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"    Job {idx}: {title[:35]} | {company[:25]} | {location[:20]}")
                     
             except Exception as e:
-                print(f"    ⚠️  Error parsing card {idx}: {str(e)[:50]}")
+                logger.warning("    ⚠️  Error parsing card %d: %.50s", idx, e)
                 continue
         
         return jobs
-        
-        def _enrich_jobs_with_details(self, jobs: List[Dict]) -> List[Dict]:
-            """
-            Fetch detailed information for each job by visiting the job page
-            """
-            enriched_jobs = []
+    
+    def _extract_company(self, card, title: str) -> Optional[str]:
+        """Extract the raw company name from a job card, returning on the first strategy that hits"""
+        # STRATEGIES 1-3: subtitle, then primary description, then company links; every
+        # candidate of a strategy is tried before moving on, so a noisy node doesn't end the search
+        for selector in _COMPANY_SELECTORS:
+            for company_elem in card.select(selector):
+                company = self._company_from_node(company_elem)
+                if company:
+                    return company
+        
+        # STRATEGY 4: Company name from the /company/<slug> URL
+        for link in card.select('a[href*="/company/"]'):
+            match = re.search(r'/company/([^/?]+)', link.get('href', ''))
+            if match:
+                # Convert slug to readable name (e.g., "microsoft-corporation" -> "Microsoft Corporation")
+                company = match.group(1).replace('-', ' ').title()
+                if len(company) >= 2:
+                    return company
+        
+        # STRATEGY 5: First h4 in the info section is usually the company
+        info_section = card.find('div', class_=lambda x: x and 'base-search-card__info' in x)
+        if info_section:
+            h4_elem = info_section.find('h4')
+            if h4_elem:
+                company = re.sub(r'\s+', ' ', h4_elem.get_text().strip())
+                
+                # Validate it's not location or time
+                if (len(company) > 2 and
+                    not re.search(r'\d+\s*(hour|day|week|month)', company, re.IGNORECASE) and
+                    not re.search(r'(remote|hybrid|on-site)', company, re.IGNORECASE)):
+                    return company
+        
+        # STRATEGY 6: Text after the title - only worth the full walk on the new lockup layout
+        if card.find('div', class_=lambda x: x and 'artdeco-entity-lockup' in x) is None:
+            return None
+        
+        found_title = False
+        for elem in card.find_all(['h3', 'h4', 'span', 'div']):
+            text = re.sub(r'\s+', ' ', elem.get_text().strip())
             
-            for i, job in enumerate(jobs, 1):
-                try:
-                    print(f"  [{i}/{len(jobs)}] Fetching: {job['title'][:40]}...")
-                    
+            if len(text) < 2:
+                continue
+            
+            # Skip if it's the title
+            if title and text in title:
+                found_title = True
+                continue
+            
+            # After finding title, next valid text is likely company
+            if found_title:
+                # Validate it's not noise
+                if (not re.search(r'\d+\s*(hour|day|week|month|minute)', text, re.IGNORECASE) and
+                    not re.search(r'^(remote|hybrid|on-site)$', text, re.IGNORECASE) and
+                    not re.search(r'^\d+$', text) and
+                    '•' not in text):
+                    return text
+        
+        return None
+    
+    @staticmethod
+    def _company_from_node(company_elem) -> Optional[str]:
+        """Company name from a candidate node, or None if it holds noise (time ago, empty)"""
+        # Company links carry a reliable aria-label ("Acme logo")
+        aria_label = company_elem.get('aria-label', '')
+        if aria_label:
+            company = _LOGO_SUFFIX.sub('', aria_label).strip()
+            if len(company) >= 2 and not _TIME_AGO.search(company):
+                return company
+        
+        company = re.sub(r'\s+', ' ', company_elem.get_text().strip())
+        # Clean up - remove location if it's in same element (format: "Company • Location")
+        if '•' in company:
+            company = company.split('•')[0].strip()
+        if len(company) >= 2 and not _TIME_AGO.search(company):
+            return company
+        return None
+    
+    def _enrich_jobs_with_details(self, jobs: List[Dict], ignore_cache: bool = False) -> List[Dict]:
+        """
+        Fetch detailed information for each job by visiting the job page
+        
+        Job pages are cached on disk by canonical URL for 24h, so repeat runs re-parse
+        the cached HTML instead of loading every page again. Only pages that carried a
+        job description are cached, never authwalls or error pages.
+        """
+        enriched_jobs = []
+        detail_cache = _get_detail_cache()
+        
+        for i, job in enumerate(jobs, 1):
+            try:
+                logger.debug("  [%d/%d] Fetching: %.40s...", i, len(jobs), job['title'])
+                
+                cache_key = _detail_cache_key(job)
+                page_source = None
+                from_cache = False
+                if detail_cache is not None and not ignore_cache:
+                    page_source = detail_cache.get(cache_key)
+                    from_cache = page_source is not None
+                
+                if page_source is None:
                     # Navigate to job page
                     self.driver.get(job['link'])
                     time.sleep(2)
-                    
-                    # Get page source
                     page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                    
-                    # Extract full description
-                    description_elem = soup.find('div', class_=lambda x: x and 'jobs-description' in x)
-                    if description_elem:
-                        job['summary'] = description_elem.get_text(separator=' ').strip()
-                        
-                        # Extract skills from description
-                        job['key_skills'] = self._extract_skills_from_text(job['summary'])
-                    
-                    # Check if it's actually Easy Apply
-                    apply_button = soup.find('button', string=re.compile(r'Easy Apply', re.I))
-                    job['is_easy_apply'] = apply_button is not None
+                
+                soup = BeautifulSoup(page_source, 'html.parser')
+                
+                # Extract full description
+                description_elem = soup.find('div', class_=lambda x: x and 'jobs-description' in x)
+                if description_elem:
+                    if detail_cache is not None and not from_cache:
+                        detail_cache.set(cache_key, page_source, expire=DETAIL_CACHE_TTL)
                     
-                    enriched_jobs.append(job)
+                    job['summary'] = description_elem.get_text(separator=' ').strip()
                     
-                except Exception as e:
-                    print(f"    ⚠️ Failed to fetch details: {str(e)[:50]}")
-                    enriched_jobs.append(job)
-                    continue
-            
-            return enriched_jobs
+                    # Extract skills from description
+                    job['key_skills'] = self._extract_skills_from_text(job['summary'])
+                
+                # Check if it's actually Easy Apply
+                apply_button = soup.find('button', string=re.compile(r'Easy Apply', re.I))
+                job['is_easy_apply'] = apply_button is not None
+                
+                enriched_jobs.append(job)
+                
+            except Exception as e:
+                logger.warning("    ⚠️ Failed to fetch details: %.50s", e)
+                self._search_errors += 1
+                enriched_jobs.append(job)
+                continue
+        
+        return enriched_jobs
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract technical skills from job description text"""
@@ -623,14 +841,59 @@ class JobScraperSession:
         print("="*60 + "\n")
 
 
+def _new_seen_ids():
+    """
+    Container for job IDs already collected in a search.
+    
+    A scalable bloom filter costs ~1 byte per ID instead of a full Python string;
+    its 0.1% false-positive rate only means an occasional job is skipped as a duplicate.
+    """
+    if HAVE_BLOOM:
+        return ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+    return set()
+
+
 # Convenience functions
-def scrape_jobs(query: str, location: str = "", num_pages: int = 1, 
-                fetch_details: bool = False, **kwargs) -> List[Dict]:
-    """Main scraping function for LinkedIn"""
+def _scrape_worker(task: Tuple) -> List[Dict]:
+    """Run one (query, location, pages) search in its own Chrome process"""
+    (query, location, num_pages), cookies, fetch_details = task
+    with JobScraperSession() as session:
+        session.load_cookies(cookies)
+        session.login_to_linkedin(wait_for_manual_login=False)
+        return session.search_jobs(query, location, num_pages, fetch_details)
+
+
+def scrape_jobs(queries: Union[str, List[Tuple[str, str, int]]], location: str = "",
+                num_pages: int = 1, fetch_details: bool = False,
+                processes: Optional[int] = None, **kwargs) -> List[Dict]:
+    """
+    Main scraping function for LinkedIn
+    
+    Args:
+        queries: A single query string, or a list of (query, location, pages) tuples
+        location: Location for a single query string
+        num_pages: Number of pages for a single query string
+        fetch_details: If True, fetches full job description for every job
+        processes: Worker processes for multiple queries (default: one per query, capped at CPU count)
+        
+    Multiple queries are sharded across a process pool with one Chrome per worker.
+    Selenium is not thread-safe, so each worker owns its own driver and reuses the
+    cookies of a single manual login instead of logging in again.
+    """
+    if isinstance(queries, str):
+        queries = [(queries, location, num_pages)]
+    
     with JobScraperSession() as session:
         session.login_to_linkedin(wait_for_manual_login=True)
-        jobs = session.search_jobs(query, location, num_pages, fetch_details)
-        return jobs
+        if len(queries) == 1:
+            query, location, num_pages = queries[0]
+            return session.search_jobs(query, location, num_pages, fetch_details)
+        cookies = session.export_cookies()
+    
+    processes = processes or min(len(queries), os.cpu_count() or 1)
+    tasks = [(query, cookies, fetch_details) for query in queries]
+    with Pool(processes=processes) as pool:
+        return list(itertools.chain.from_iterable(pool.imap_unordered(_scrape_worker, tasks)))
 
 
 def init_driver(**kwargs):
@@ -0,0 +1,476 @@
+import os
+import tempfile
+import queue
+import atexit
+import asyncio
+import threading
+from typing import NamedTuple, Optional
+from contextlib import contextmanager
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import httpx
+    HAVE_HTTPX = True
+except ImportError:
+    HAVE_HTTPX = False
+
+try:
+    import h2  # enables HTTP/2 in httpx
+    HAVE_HTTP2 = True
+except ImportError:
+    HAVE_HTTP2 = False
+
+try:
+    import diskcache
+    HAVE_DISKCACHE = True
+except ImportError:
+    HAVE_DISKCACHE = False
+
+try:
+    from playwright.async_api import async_playwright
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    HAVE_PLAYWRIGHT = True
+except ImportError:
+    HAVE_PLAYWRIGHT = False
+
+
+class Job(NamedTuple):
+    """
+    One scraped Naukri job. A tuple, so it carries no per-instance __dict__;
+    use job._asdict() where a plain dict is needed.
+    """
+    title: Optional[str]
+    company: Optional[str]
+    location: Optional[str]
+    summary: Optional[str]
+    link: Optional[str]
+
+
+# URL patterns the scraping browser never downloads
+BLOCKED_RESOURCE_URLS = ['*.css', '*.woff', '*.woff2', '*.ttf', '*.otf']
+
+
+def init_driver(headless=True):
+    """
+    Initialize and return a Selenium WebDriver instance.
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    # Only the DOM is scraped - skip images, notifications, extensions and GPU work
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+
+    # Selenium Manager resolves (and caches) a matching chromedriver unless one is given
+    service = Service(executable_path=os.environ.get('CHROME_DRIVER_PATH'))
+
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    try:
+        # Stylesheets and fonts never affect the parsed HTML, so don't download them
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+    except Exception:
+        pass
+    return driver
+
+
+class DriverPool:
+    """
+    Pool of warm WebDriver instances shared by scrape_jobs calls.
+    Starting Chrome costs 1-2s, so drivers are reset and reused instead of quit.
+    """
+
+    def __init__(self, size=1, headless=True):
+        self.size = size
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def _warm(self):
+        with self._lock:
+            while len(self._drivers) < self.size:
+                driver = init_driver(headless=self.headless)
+                self._drivers.append(driver)
+                self._idle.put(driver)
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """
+        Borrow a driver for the duration of a with-block.
+        """
+        self._warm()
+        driver = self._idle.get(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def release(self, driver):
+        """
+        Reset a driver and return it to the pool; broken drivers are dropped.
+        """
+        try:
+            driver.get('about:blank')
+            driver.delete_all_cookies()
+        except Exception:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def shutdown(self):
+        """
+        Quit every driver so no chromedriver processes outlive the interpreter.
+        """
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+# Realistic browser headers for the plain-HTTP path
+HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+# CSS selectors, matched natively by Lexbor for every page and card
+_JOB_CARDS = 'article.jobTuple.bgWhite.br4.mb-8'
+_TITLE = 'a.title'
+_SUBTITLE = 'a.subTitle'
+_LOCATION = 'li.location'
+_SUMMARY = 'div.job-description.fs12.grey-text'
+# All field selectors in one group, so each card is queried once
+_FIELDS = ', '.join((_TITLE, _SUBTITLE, _LOCATION, _SUMMARY))
+# Wait condition for the first card, built once and shared by every page load
+_CARD_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, 'article.jobTuple'))
+
+# Shared HTTP/2 client: the TCP + TLS setup is paid once and reused by every call
+_CLIENT = None
+if HAVE_HTTPX:
+    _CLIENT = httpx.Client(
+        http2=HAVE_HTTP2,
+        headers=HTTP_HEADERS,
+        timeout=10,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+    )
+    atexit.register(_CLIENT.close)
+
+# Downloaded pages with their validators, for conditional GETs on the next scrape
+PAGE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'joblancer_pages')
+PAGE_CACHE_TTL = 7 * 24 * 60 * 60
+_PAGE_CACHE = diskcache.Cache(PAGE_CACHE_DIR) if HAVE_DISKCACHE else None
+
+_pools = {}
+
+
+def get_driver_pool(headless=True):
+    """
+    Return the shared driver pool for the given headless mode.
+    """
+    if headless not in _pools:
+        pool = DriverPool(headless=headless)
+        atexit.register(pool.shutdown)
+        _pools[headless] = pool
+    return _pools[headless]
+
+
+# Playwright's sync API is bound to the thread that started it, so each thread
+# launches its own browser once and reuses it; scrape_jobs calls only open contexts.
+_playwright_local = threading.local()
+
+
+def get_browser(headless=True):
+    """
+    Return this thread's shared Playwright Chromium browser, launching it on first use.
+    """
+    browsers = getattr(_playwright_local, 'browsers', None)
+    if browsers is None:
+        playwright = sync_playwright().start()
+        browsers = _playwright_local.browsers = {}
+        _playwright_local.playwright = playwright
+        atexit.register(_stop_playwright, playwright, browsers)
+    if headless not in browsers:
+        browsers[headless] = _playwright_local.playwright.chromium.launch(headless=headless)
+    return browsers[headless]
+
+
+def _stop_playwright(playwright, browsers):
+    try:
+        for browser in browsers.values():
+            browser.close()
+        playwright.stop()
+    except Exception:
+        pass
+
+
+def search_urls(query, location, num_pages=1):
+    """
+    Build the Naukri.com result page URLs for a search.
+    """
+    base_url = f"https://www.naukri.com/{query}-jobs-in-{location}"
+    return [f"{base_url}?k={query}&l={location}&page={page}" for page in range(1, num_pages + 1)]
+
+
+def find_job_cards(html):
+    """
+    Return the job card elements of one result page.
+    """
+    return LexborHTMLParser(html).css(_JOB_CARDS)
+
+
+def parse_page(html):
+    """
+    Parse one result page straight into Job records.
+    Card nodes keep their whole page tree alive, so only the records leave this
+    function and the tree is freed as soon as it returns.
+    """
+    tree = LexborHTMLParser(html)
+    return [parse_job_card(card) for card in tree.css(_JOB_CARDS)]
+
+
+def page_html(driver):
+    """
+    Return the rendered DOM of the current page as UTF-8 bytes.
+    Read over CDP so the parser gets bytes directly; falls back to page_source.
+    """
+    try:
+        result = driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': 'document.documentElement.outerHTML',
+            'returnByValue': True,
+        })
+        return result['result']['value'].encode('utf-8', 'replace')
+    except Exception:
+        return driver.page_source
+
+
+def iter_page_sources(driver, query, location, num_pages=1):
+    """
+    Load each result page in the driver and yield its HTML.
+    """
+    for url in search_urls(query, location, num_pages):
+        driver.get(url)
+        try:
+            # Wait for the first job card instead of a fixed delay
+            WebDriverWait(driver, 10).until(_CARD_PRESENT)
+        except TimeoutException:
+            # No cards rendered (e.g. past the last page) - parse whatever loaded
+            pass
+        yield page_html(driver)
+
+
+def search_jobs(driver, query, location, num_pages=1):
+    """
+    Search for jobs on Naukri.com and return a list of job card elements.
+    """
+    jobs = []
+    for html in iter_page_sources(driver, query, location, num_pages):
+        jobs.extend(find_job_cards(html))
+    return jobs
+
+
+def stream_jobs(pages, workers=None, maxsize=4):
+    """
+    Parse pages on other cores while the next ones are still downloading and yield Job records.
+    Each page from `pages` is handed to a process pool as soon as it arrives; at most
+    `maxsize` pages are in flight, so memory stays bounded. Records come out in page order.
+    """
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for html in pages:
+            in_flight.append(executor.submit(parse_page, html))
+            if len(in_flight) >= maxsize:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def iter_page_sources_playwright(context, query, location, num_pages=1):
+    """
+    Load each result page in a Playwright browser context and yield its HTML.
+    """
+    page = context.new_page()
+    for url in search_urls(query, location, num_pages):
+        page.goto(url, wait_until='domcontentloaded')
+        try:
+            page.wait_for_selector('article.jobTuple', timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
+        yield page.content()
+
+
+def fetch_pages_http(query, location, num_pages=1):
+    """
+    Fetch the result pages over plain HTTP (no browser) and yield their HTML in page order.
+    Pages that fail to download are skipped.
+    """
+    if not HAVE_HTTPX:
+        return
+
+    def fetch(url):
+        cached = _PAGE_CACHE.get(('page', url)) if _PAGE_CACHE is not None else None
+        headers = {}
+        if cached:
+            # Conditional GET: an unchanged page comes back as an empty 304
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        try:
+            resp = _CLIENT.get(url, headers=headers)
+            if resp.status_code == 304 and cached:
+                return cached['html']
+            resp.raise_for_status()
+        except httpx.HTTPError:
+            return b''
+        if _PAGE_CACHE is not None:
+            _PAGE_CACHE.set(('page', url), {
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'html': resp.content,
+            }, expire=PAGE_CACHE_TTL)
+        return resp.content
+
+    urls = search_urls(query, location, num_pages)
+    # Requests are multiplexed as concurrent HTTP/2 streams over the shared connection
+    with ThreadPoolExecutor(max_workers=min(len(urls), 8) or 1) as executor:
+        for html in executor.map(fetch, urls):
+            if html:
+                yield html
+
+
+def search_jobs_http(query, location, num_pages=1):
+    """
+    Search for jobs on Naukri.com over plain HTTP (no browser) and return a list of job card elements.
+    Only finds cards that are rendered server-side; returns an empty list otherwise.
+    """
+    jobs = []
+    for html in fetch_pages_http(query, location, num_pages):
+        jobs.extend(find_job_cards(html))
+    return jobs
+
+
+async def search_jobs_async(query, location, num_pages=1, max_concurrency=5, headless=True):
+    """
+    Fetch all result pages concurrently with Playwright and return a list of job card elements.
+    One browser is shared; every page gets its own (cheap) browser context.
+    """
+    if not HAVE_PLAYWRIGHT:
+        raise RuntimeError("playwright is not installed")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+
+        async def fetch(url):
+            async with semaphore:
+                context = await browser.new_context()
+                try:
+                    page = await context.new_page()
+                    await page.goto(url, wait_until='domcontentloaded')
+                    return await page.content()
+                finally:
+                    await context.close()
+
+        try:
+            pages = await asyncio.gather(*[fetch(url) for url in search_urls(query, location, num_pages)])
+        finally:
+            await browser.close()
+
+    jobs = []
+    for html in pages:
+        jobs.extend(find_job_cards(html))
+    return jobs
+
+
+def parse_job_card(card, _fields=_FIELDS, _Job=Job):
+    """
+    Parse a single job card selectolax node and return a Job.
+    """
+    # _fields/_Job are bound as defaults so the per-card lookups are locals, not globals
+    title = company = location = summary = link = None
+    # One native query returns every field node in document order; keep the first of each
+    for node in card.css(_fields):
+        tag = node.tag
+        if tag == 'a':
+            attrs = node.attributes
+            if 'title' in (attrs.get('class') or '').split():
+                if title is None:
+                    title = node.text().strip()
+                    link = attrs.get('href')
+            elif company is None:
+                company = node.text().strip()
+        elif tag == 'li':
+            if location is None:
+                location = node.text().strip()
+        elif summary is None:
+            summary = node.text().strip()
+    return _Job(title, company, location, summary, link)
+
+
+def scrape_jobs(query, location, num_pages=1, headless=True, use_http=True):
+    """
+    Main function to scrape jobs from Naukri.com.
+    Tries plain HTTP first and only starts a browser when that finds no cards;
+    Playwright is preferred, Selenium is used when it is not installed.
+    Returns a list of Job records.
+    """
+    # Each page is parsed and dropped before the next one, so only Job records accumulate
+    if use_http:
+        jobs = [job for html in fetch_pages_http(query, location, num_pages) for job in parse_page(html)]
+        if jobs:
+            return jobs
+    if HAVE_PLAYWRIGHT:
+        # Fresh, isolated context per call on the long-lived browser
+        context = get_browser(headless).new_context()
+        try:
+            pages = iter_page_sources_playwright(context, query, location, num_pages)
+            return [job for html in pages for job in parse_page(html)]
+        finally:
+            context.close()
+    with get_driver_pool(headless).acquire() as driver:
+        # Parse each page while the driver loads the next one
+        jobs = list(stream_jobs(iter_page_sources(driver, query, location, num_pages)))
+    return jobs
+
+
+if __name__ == "__main__":
+    # Example usage
+    jobs = scrape_jobs("python-developer", "bangalore", num_pages=2, headless=False)
+    for job in jobs:
+        print(job)
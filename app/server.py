@@ -1,12 +1,23 @@
 import os
 import sys
+import json
 import time
-import traceback
+import queue
+import logging
 import uuid
 import threading
+from collections import OrderedDict, deque
 import re
+import tempfile
+import hashlib
+import atexit
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 
 # Fix imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,26 +28,69 @@ if current_dir not in sys.path:
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from flask import Flask, jsonify, request, send_from_directory
-from werkzeug.utils import secure_filename
+from flask import Flask, Request, Response, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
 
 try:
-    from matching.matcher import JobMatcher
-    from parsers.resume_parser import ResumeParser
-    from scraping.job_scraper import JobScraperSession
-    from applier.job_applier import LinkedInJobApplier as JobApplier
-    print("✅ All modules imported successfully")
-except ImportError as e:
-    print(f"❌ IMPORT ERROR: {e}")
-    try:
-        from app.matching.matcher import JobMatcher
-        from app.parsers.resume_parser import ResumeParser
-        from app.scraping.job_scraper import JobScraperSession
-        from app.applier.job_applier import LinkedInJobApplier as JobApplier
-        print("✅ All modules imported successfully (with app. prefix)")
-    except ImportError as e2:
-        print(f"❌ Alternative import also failed: {e2}")
-        raise
+    import redis
+    HAVE_REDIS = True
+except ImportError:
+    HAVE_REDIS = False
+
+try:
+    import diskcache
+    HAVE_DISKCACHE = True
+except ImportError:
+    HAVE_DISKCACHE = False
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+
+# The matcher, parsers, scraper and applier pull in scikit-learn, spaCy, PyMuPDF
+# and Selenium, so they are imported on first use rather than at server start-up
+_app_modules = None
+_app_modules_lock = threading.Lock()
+
+
+def _lazy_imports() -> SimpleNamespace:
+    """Import the heavy app modules once and return them as a namespace"""
+    global _app_modules
+    if _app_modules is not None:
+        return _app_modules
+    with _app_modules_lock:
+        if _app_modules is not None:
+            return _app_modules
+        try:
+            from matching.matcher import JobMatcher
+            from parsers.resume_parser import ResumeParser
+            from scraping.job_scraper import JobScraperSession
+            from applier.job_applier import LinkedInJobApplier as JobApplier
+            logger.info("✅ All modules imported successfully")
+        except ImportError as e:
+            logger.error("❌ IMPORT ERROR: %s", e)
+            try:
+                from app.matching.matcher import JobMatcher
+                from app.parsers.resume_parser import ResumeParser
+                from app.scraping.job_scraper import JobScraperSession
+                from app.applier.job_applier import LinkedInJobApplier as JobApplier
+                logger.info("✅ All modules imported successfully (with app. prefix)")
+            except ImportError as e2:
+                logger.error("❌ Alternative import also failed: %s", e2)
+                raise
+        _app_modules = SimpleNamespace(
+            JobMatcher=JobMatcher,
+            ResumeParser=ResumeParser,
+            JobScraperSession=JobScraperSession,
+            JobApplier=JobApplier
+        )
+    return _app_modules
 
 BASE_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = BASE_DIR.parent
@@ -44,9 +98,110 @@ UPLOAD_DIR = PROJECT_ROOT / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
 ALLOWED_EXTENSIONS = {"pdf"}
+# Larger request bodies are refused with 413 before they are read; uploads up to
+# UPLOAD_SPOOL_BYTES stay in memory, anything bigger is spooled to a temp file
+MAX_UPLOAD_BYTES = 16 << 20
+UPLOAD_SPOOL_BYTES = 1 << 20
+
+# Idle SSE streams send a comment this often so proxies don't close them
+SSE_KEEPALIVE_SECONDS = 30
+# Each open stream holds a server thread; after this long it ends and the client polls instead
+SSE_MAX_STREAM_SECONDS = 10 * 60
+TERMINAL_STAGES = ('complete', 'error')
+
+# Kept well under SESSION_TTL_SECONDS so a session waiting for login fails on its own
+# timeout instead of being pruned mid-wait
+LOGIN_TIMEOUT_SECONDS = 15 * 60
+QUESTIONS_TIMEOUT_SECONDS = 300
+
+# Sessions idle for longer than this are pruned (browser closed, resume deleted)
+SESSION_TTL_SECONDS = 3600
+SESSION_PRUNE_INTERVAL = 60
+# Hard cap on live sessions (least recently used is closed first), and how long a
+# finished or failed session stays around for the client to read its final status
+SESSION_MAX = 1024
+SESSION_FINISHED_GRACE_SECONDS = 60
+REDIS_URL = os.environ.get("REDIS_URL")
+
+# Scraped jobs are shared by every user searching the same thing; matching stays per-resume.
+# Kept outside the source tree; set JOBS_CACHE_DIR to move it.
+JOBS_CACHE_DIR = Path(os.environ.get("JOBS_CACHE_DIR", Path.home() / ".joblancer_jobs_cache"))
+JOBS_CACHE_TTL = 3600
+
+# Title/company cleanup in _format_matches, compiled once
+# Pattern like "Developer Developer" or "Python Developer Python Developer"
+_DEDUP_PATTERNS = [
+    (re.compile(r'\b([A-Za-z]+\s+Developer)\s+\1\b', re.IGNORECASE), r'\1'),
+    (re.compile(r'\b([A-Za-z]+\s+Engineer)\s+\1\b', re.IGNORECASE), r'\1'),
+    (re.compile(r'\b(Python\s+Developer)\s+\1\b', re.IGNORECASE), r'\1'),
+]
+_WS_RE = re.compile(r'\s+')
+
+# Numeric match fields, rounded together in _format_matches (last one to 2 places)
+_SCORE_FIELDS = ("final_score", "similarity_score", "experience_score",
+                 "skills_score", "title_relevance", "skill_match_percentage")
+
+# PDF text extraction and NLP are CPU-bound; run them in worker processes
+# (each keeps its spaCy model loaded) instead of on the request thread's GIL
+PARSE_WORKERS = min(os.cpu_count() or 1, 4)
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+# Job searches and batch applies share one capped thread pool; when every
+# worker is busy new requests get a 503 instead of another thread
+BACKGROUND_WORKERS = int(os.environ.get("BG_WORKERS", 8))
+BUSY_RETRY_AFTER_SECONDS = 30
+_background = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="job")
+_background_slots = threading.BoundedSemaphore(BACKGROUND_WORKERS)
+atexit.register(_background.shutdown, wait=False)
+
+# Logged-in browsers kept between searches so repeat searches skip Chrome start-up and login.
+# A browser is only reused by the client it was logged in for, identified by this cookie.
+DRIVER_POOL_SIZE = min(os.cpu_count() or 1, 3)
+DRIVER_IDLE_TIMEOUT = 30 * 60
+CLIENT_COOKIE = "joblancer_client"
+CLIENT_COOKIE_MAX_AGE = 30 * 24 * 60 * 60
+_CLIENT_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+# One matcher for every search. get_top_matches refits the shared TF-IDF
+# vectorizer on each call, so concurrent searches take turns on the lock.
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def _get_matcher():
+    """Shared JobMatcher, created on first use (call with _matcher_lock held)"""
+    global _matcher
+    if _matcher is None:
+        _matcher = _lazy_imports().JobMatcher()
+    return _matcher
+
+
+@lru_cache(maxsize=None)
+def _get_jobs_cache():
+    """Shared scraped-jobs cache, opened on first use (None without diskcache)"""
+    return diskcache.Cache(str(JOBS_CACHE_DIR)) if HAVE_DISKCACHE else None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Resume-parsing worker processes, started on the first upload. Workers are
+    spawned, not forked, so they don't inherit the server's threads, locks and browsers.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        with _parse_pool_lock:
+            if _parse_pool is None:
+                _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS,
+                                                  mp_context=multiprocessing.get_context("spawn"))
+                atexit.register(_parse_pool.shutdown, wait=False, cancel_futures=True)
+    return _parse_pool
+
 
-# Global dict to store job session states
-job_sessions = {}
+@lru_cache(maxsize=None)
+def _get_resume_parser():
+    """Shared ResumeParser for uploads; it keeps no per-resume state"""
+    return _lazy_imports().ResumeParser(str(UPLOAD_DIR))
 
 
 class JobSession:
@@ -59,15 +214,322 @@ class JobSession:
         self.details = []
         self.results = None
         self.scraper_session = None
+        # Browser identity of the client that started the search (see CLIENT_COOKIE)
+        self.client_id = None
+        # True once the browser is verified as logged into LinkedIn; only then may it be pooled
+        self.logged_in = False
         self.resume_data = None
+        # The upload is kept in memory; it only goes to disk if the applier needs it
+        self.resume_name = None
+        self.resume_bytes = None
         self.resume_path = None
         self.matches = []
-        self.login_confirmed = False
-        self.questions_confirmed = False  # NEW: Track questions confirmation
+        # Set by the confirm endpoints; the background threads block on them
+        self.login_event = threading.Event()
+        self.questions_event = threading.Event()
+        # One queue per open SSE stream, so every subscriber gets every snapshot
+        self._streams = {"job": [], "apply": []}
+        self._streams_lock = threading.Lock()
+        self.closed = False
+        self.last_active = time.monotonic()
+
+    def job_status(self) -> Dict:
+        status = {
+            "stage": self.stage,
+            "message": self.message,
+            "progress": self.progress,
+            "details": self.details,
+        }
+        if self.stage == 'complete':
+            status["results"] = self.results
+        return status
+
+    def publish_job_status(self):
+        """Push the current job search state to the job status stream"""
+        data = _dumps(self.job_status())
+        self._publish("job", self.stage, data)
+        job_sessions.save_status(self, "job", data)
+
+    def apply_status(self) -> Dict:
+        """JSON-safe snapshot of the application progress"""
+        return {**self.apply_progress, 'recent_results': list(self.apply_progress['recent_results'])}
+
+    def publish_apply_status(self):
+        """Push the current application progress to the apply status stream"""
+        data = _dumps(self.apply_status())
+        self._publish("apply", self.apply_progress['stage'], data)
+        job_sessions.save_status(self, "apply", data)
+
+    def subscribe(self, kind: str) -> queue.Queue:
+        """New event queue for one SSE stream of `kind` ("job" or "apply")"""
+        events = queue.Queue()
+        with self._streams_lock:
+            self._streams[kind].append(events)
+        return events
+
+    def unsubscribe(self, kind: str, events: queue.Queue):
+        with self._streams_lock:
+            if events in self._streams[kind]:
+                self._streams[kind].remove(events)
+
+    def _publish(self, kind: str, stage: Optional[str], data: Optional[str]):
+        with self._streams_lock:
+            subscribers = list(self._streams[kind])
+        for events in subscribers:
+            events.put((stage, data))
+
+    def write_resume_file(self) -> Optional[str]:
+        """Write the uploaded resume to disk for the applier's file input (once)"""
+        if not self.resume_path and self.resume_bytes is not None:
+            path = UPLOAD_DIR / self.resume_name
+            path.write_bytes(self.resume_bytes)
+            self.resume_path = str(path)
+            self.resume_bytes = None
+        return self.resume_path
+
+    def release_browser(self):
+        """Hand a logged-in browser back to this client's pool; close any other"""
+        if not self.scraper_session:
+            return
+        if self.logged_in:
+            _driver_pool.release(self.scraper_session, self.client_id)
+        else:
+            try:
+                self.scraper_session.cleanup()
+            except Exception:
+                pass
+        self.scraper_session = None
+
+    def close(self):
+        """Release the browser and resume file held by this session"""
+        # Wake any open streams so they end instead of waiting on a dead session
+        self.closed = True
+        for kind in self._streams:
+            self._publish(kind, None, None)
+        self.resume_bytes = None
+        self.release_browser()
+        if self.resume_path and os.path.exists(self.resume_path):
+            try:
+                os.unlink(self.resume_path)
+            except OSError:
+                pass
+
+
+def _close_session(job_session: JobSession):
+    """
+    Close a dropped session on its own daemon thread. Pruning runs inside whichever
+    request touched the store, so shutting down Chrome must neither delay that
+    request nor wait for its response (an SSE stream may stay open for minutes).
+    """
+    threading.Thread(target=job_session.close, daemon=True,
+                     name=f"close-{job_session.session_id[:8]}").start()
+
+
+class SessionStore:
+    """
+    Registry of job sessions with idle expiry and an LRU size cap.
+    Live sessions (browser, events, queues) stay in this process, so the server
+    runs as a single worker; multi-worker deploys are not supported. When REDIS_URL
+    is set, status snapshots are also mirrored to Redis with a TTL, which only lets
+    a status poll still answer with the last known state after a restart.
+    """
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = SESSION_TTL_SECONDS,
+                 maxsize: int = SESSION_MAX):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_prune = time.monotonic()
+        self._redis = redis.Redis.from_url(redis_url) if (redis_url and HAVE_REDIS) else None
+
+    def _key(self, session_id: str) -> str:
+        return f"joblancer:session:{session_id}"
+
+    def get(self, session_id: str) -> Optional[JobSession]:
+        self._prune()
+        with self._lock:
+            job_session = self._sessions.get(session_id)
+            if job_session:
+                self._sessions.move_to_end(session_id)
+        if job_session:
+            job_session.last_active = time.monotonic()
+        return job_session
+
+    def put(self, session_id: str, job_session: JobSession):
+        with self._lock:
+            self._sessions[session_id] = job_session
+            self._sessions.move_to_end(session_id)
+            evicted = []
+            while len(self._sessions) > self.maxsize:
+                evicted.append(self._sessions.popitem(last=False))
+        for old_id, old_session in evicted:
+            logger.info("[Session %s] Evicted, session limit of %d reached", old_id, self.maxsize)
+            _close_session(old_session)
+        self._prune()
+
+    def delete(self, session_id: str):
+        with self._lock:
+            job_session = self._sessions.pop(session_id, None)
+        if job_session:
+            _close_session(job_session)
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._key(session_id))
+            except redis.RedisError:
+                pass
+
+    def expire_later(self, session_id: str, delay: float = SESSION_FINISHED_GRACE_SECONDS):
+        """Delete a finished session once the client has had time to fetch its final status"""
+        timer = threading.Timer(delay, self.delete, args=(session_id,))
+        timer.daemon = True
+        timer.start()
+
+    def save_status(self, job_session: JobSession, kind: str, data: str):
+        job_session.last_active = time.monotonic()
+        if self._redis is None:
+            return
+        try:
+            key = self._key(job_session.session_id)
+            pipe = self._redis.pipeline()
+            pipe.hset(key, kind, data)
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("⚠️  Could not mirror session status to Redis: %s", e)
+
+    def load_status(self, session_id: str, kind: str) -> Optional[str]:
+        """Status snapshot saved by whichever worker owns the session"""
+        if self._redis is None:
+            return None
+        try:
+            data = self._redis.hget(self._key(session_id), kind)
+        except redis.RedisError:
+            return None
+        return data.decode() if data else None
+
+    def _prune(self):
+        now = time.monotonic()
+        if now - self._last_prune < SESSION_PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        with self._lock:
+            expired = [sid for sid, js in self._sessions.items() if now - js.last_active > self.ttl]
+        for session_id in expired:
+            logger.info("[Session %s] Expired after %ds idle", session_id, self.ttl)
+            self.delete(session_id)
+
+
+job_sessions = SessionStore(REDIS_URL)
+
+
+class DriverPool:
+    """
+    Idle, logged-in JobScraperSession browsers waiting to be reused by the next search.
+    Each browser carries somebody's LinkedIn login, so it is kept per client identity
+    and only handed back to that client; without an identity it is closed instead.
+    Browsers idle for longer than `idle_timeout`, or beyond `size` in total, are closed.
+    """
+    def __init__(self, size: int = DRIVER_POOL_SIZE, idle_timeout: int = DRIVER_IDLE_TIMEOUT):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = {}  # client_id -> [(scraper_session, last_used)]
+        self._lock = threading.Lock()
+
+    def acquire(self, client_id: Optional[str]):
+        """Return a live session logged in for this client, or None if there is none"""
+        if not client_id:
+            return None
+        while True:
+            with self._lock:
+                idle = self._idle.get(client_id)
+                if not idle:
+                    return None
+                session, last_used = idle.pop()
+                if not idle:
+                    del self._idle[client_id]
+            if time.monotonic() - last_used < self.idle_timeout and self._alive(session):
+                return session
+            self._close(session)
+
+    def release(self, session, client_id: Optional[str]):
+        """Keep a session for this client's next search; dead, surplus or anonymous ones are closed"""
+        if not client_id or not self._alive(session):
+            self._close(session)
+            return
+        for stale in self._take_expired():
+            self._close(stale)
+        with self._lock:
+            if sum(len(idle) for idle in self._idle.values()) < self.size:
+                self._idle.setdefault(client_id, []).append((session, time.monotonic()))
+                return
+        self._close(session)
+
+    def _take_expired(self) -> List:
+        """Remove and return browsers idle for longer than idle_timeout"""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for client_id in list(self._idle):
+                idle = self._idle[client_id]
+                expired.extend(session for session, last_used in idle if now - last_used >= self.idle_timeout)
+                idle[:] = [(session, last_used) for session, last_used in idle if now - last_used < self.idle_timeout]
+                if not idle:
+                    del self._idle[client_id]
+        return expired
+
+    @staticmethod
+    def _alive(session) -> bool:
+        try:
+            return bool(session.driver) and bool(session.driver.current_url)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(session):
+        try:
+            session.cleanup()
+        except Exception:
+            pass
+
+
+_driver_pool = DriverPool()
+
+
+def _dumps(obj) -> str:
+    """Serialize a status payload (orjson when installed, it also handles NumPy values)"""
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that makes jsonify() encode with orjson"""
+    def dumps(self, obj, **kwargs) -> str:
+        return _dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class UploadRequest(Request):
+    """Request that keeps uploaded files in memory up to UPLOAD_SPOOL_BYTES"""
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_BYTES, mode="rb+")
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.request_class = UploadRequest
+    app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
+    if HAVE_ORJSON:
+        app.json = OrjsonProvider(app)
+
+    @app.errorhandler(RequestEntityTooLarge)
+    def upload_too_large(_exc):
+        return jsonify({
+            "status": "error",
+            "message": f"Upload too large (max {MAX_UPLOAD_BYTES >> 20} MB)."
+        }), 413
 
     @app.get("/")
     def serve_frontend():
@@ -84,9 +546,11 @@ def create_app() -> Flask:
     @app.post("/api/match-jobs-async")
     def match_jobs_async():
         """Start async job matching process (NO AUTO-APPLY)"""
-        print("=" * 60)
-        print("📨 Received match-jobs-async request")
-        print("=" * 60)
+        logger.info("📨 Received match-jobs-async request")
+        
+        # Refuse oversized uploads from the header alone, before the body is parsed
+        if request.content_length and request.content_length > MAX_UPLOAD_BYTES:
+            raise RequestEntityTooLarge()
         
         try:
             payload, errors = _parse_form_data(request)
@@ -100,39 +564,35 @@ def create_app() -> Flask:
             # Create session
             session_id = str(uuid.uuid4())
             job_session = JobSession(session_id)
-            job_sessions[session_id] = job_session
-
-            # Save and parse resume
-            saved_path = _save_resume(resume_file)
-            resume_parser = ResumeParser(str(UPLOAD_DIR))
-            resume_data = resume_parser.parse_resume(saved_path.name)
-
-            if "error" in resume_data:
-                saved_path.unlink(missing_ok=True)
-                job_session.stage = 'error'
-                job_session.message = resume_data["error"]
-                return jsonify({"status": "error", "message": resume_data["error"]}), 400
-
-            job_session.resume_data = resume_data
-            job_session.resume_path = str(saved_path)
+            job_session.client_id = _client_id(request)
+            job_sessions.put(session_id, job_session)
+
+            # Read the resume and start parsing it from memory; the search thread
+            # picks up the result once Chrome is up, so the two overlap
+            job_session.resume_name, job_session.resume_bytes = _read_resume(resume_file)
+            resume_future = _get_parse_pool().submit(
+                _get_resume_parser().parse_resume, job_session.resume_name, job_session.resume_bytes
+            )
 
             # Start async processing (WITHOUT auto-apply)
-            thread = threading.Thread(
-                target=_process_job_search,
-                args=(session_id, payload),
-                daemon=True
-            )
-            thread.start()
+            if not _start_background(_process_job_search, session_id, payload, resume_future):
+                resume_future.cancel()
+                job_sessions.delete(session_id)
+                return _busy_response()
 
-            return jsonify({
+            response = jsonify({
                 "status": "started",
                 "session_id": session_id,
                 "message": "Job search started"
-            }), 200
+            })
+            response.set_cookie(CLIENT_COOKIE, job_session.client_id, max_age=CLIENT_COOKIE_MAX_AGE,
+                                httponly=True, samesite="Lax")
+            return response, 200
 
+        except RequestEntityTooLarge:
+            raise
         except Exception as exc:
-            print(f"❌ EXCEPTION: {str(exc)}")
-            traceback.print_exc()
+            logger.exception("❌ EXCEPTION: %s", exc)
             return jsonify({
                 "status": "error",
                 "message": f"Server error: {str(exc)}"
@@ -140,26 +600,33 @@ def create_app() -> Flask:
 
     @app.get("/api/job-status/<session_id>")
     def get_job_status(session_id: str):
-        """Poll for job search status"""
+        """Poll for job search status (fallback for clients without SSE)"""
         job_session = job_sessions.get(session_id)
         
         if not job_session:
+            # Owned by another worker (or from before a restart)?
+            saved = job_sessions.load_status(session_id, "job")
+            if saved:
+                return Response(saved, mimetype="application/json")
             return jsonify({
                 "status": "error",
                 "message": "Session not found"
             }), 404
 
-        response = {
-            "stage": job_session.stage,
-            "message": job_session.message,
-            "progress": job_session.progress,
-            "details": job_session.details,
-        }
+        return jsonify(job_session.job_status()), 200
 
-        if job_session.stage == 'complete':
-            response["results"] = job_session.results
+    @app.get("/api/job-status-stream/<session_id>")
+    def stream_job_status(session_id: str):
+        """Server-Sent Events stream of job search status"""
+        job_session = job_sessions.get(session_id)
+        
+        if not job_session:
+            return jsonify({"status": "error", "message": "Session not found"}), 404
 
-        return jsonify(response), 200
+        return _event_stream(
+            job_session, "job",
+            lambda: (job_session.stage, _dumps(job_session.job_status()))
+        )
 
     @app.post("/api/confirm-login/<session_id>")
     def confirm_login(session_id: str):
@@ -172,31 +639,30 @@ def create_app() -> Flask:
         if job_session.stage != 'waiting_login':
             return jsonify({"status": "error", "message": "Not waiting for login"}), 400
 
-        job_session.login_confirmed = True
+        job_session.login_event.set()
         job_session.stage = 'scraping'
         job_session.message = 'Login confirmed! Starting job search...'
         job_session.progress = 30
+        job_session.publish_job_status()
 
         return jsonify({"status": "ok"}), 200
 
     @app.post("/api/confirm-questions/<session_id>")
     def confirm_questions(session_id: str):
         """NEW: User confirms they've answered additional questions"""
-        print(f"\n{'='*70}")
-        print(f"[API] Received questions confirmation for session: {session_id}")
-        print(f"{'='*70}\n")
+        logger.info("[API] Received questions confirmation for session: %s", session_id)
         
         job_session = job_sessions.get(session_id)
         
         if not job_session:
-            print(f"[API] ❌ Session not found: {session_id}")
+            logger.warning("[API] ❌ Session not found: %s", session_id)
             return jsonify({"status": "error", "message": "Session not found"}), 404
 
         # Set flag to continue application process
-        print(f"[API] Setting questions_confirmed = True")
-        job_session.questions_confirmed = True
+        logger.debug("[API] Setting questions_event")
+        job_session.questions_event.set()
         
-        print(f"[API] ✅ Questions confirmed successfully\n")
+        logger.info("[API] ✅ Questions confirmed successfully")
         return jsonify({"status": "ok", "message": "Questions confirmed"}), 200
 
     @app.post("/api/batch-apply/<session_id>")
@@ -210,11 +676,13 @@ def create_app() -> Flask:
         if job_session.stage != 'complete':
             return jsonify({"status": "error", "message": "Job search not complete"}), 400
 
+        params, errors = _parse_batch_apply_params(request)
+        if errors:
+            return jsonify({"status": "error", "message": errors}), 400
+        threshold = params['threshold']
+        max_applications = params['max_applications']
+
         try:
-            data = request.get_json()
-            threshold = data.get('threshold', 0.6)
-            max_applications = data.get('max_applications', 10)
-            
             # Start batch application in background thread
             job_session.stage = 'applying'
             job_session.apply_progress = {
@@ -224,26 +692,26 @@ def create_app() -> Flask:
                 'applied': 0,
                 'failed': 0,
                 'current_job': None,
-                'recent_results': [],
+                'recent_results': deque(maxlen=5),  # last 5 results for display
                 'details': [],
                 'waiting_for_questions': False,  # CRITICAL: Initialize this flag
                 'current_job_title': None  # CRITICAL: Initialize this too
             }
             
-            print(f"[Session {session_id}] ✅ Apply progress initialized with question flags")
+            logger.debug("[Session %s] ✅ Apply progress initialized with question flags", session_id)
+            job_session.publish_apply_status()
             
-            thread = threading.Thread(
-                target=_apply_batch_jobs,
-                args=(session_id, threshold, max_applications),
-                daemon=True
-            )
-            thread.start()
+            if not _start_background(_apply_batch_jobs, session_id, threshold, max_applications):
+                job_session.stage = 'complete'
+                job_session.apply_progress['stage'] = 'error'
+                job_session.apply_progress['error'] = 'Server busy, please retry'
+                job_session.publish_apply_status()
+                return _busy_response()
             
             return jsonify({"status": "started", "message": "Batch application started"}), 200
 
         except Exception as exc:
-            print(f"❌ Batch apply error: {str(exc)}")
-            traceback.print_exc()
+            logger.exception("❌ Batch apply error: %s", exc)
             return jsonify({"status": "error", "message": str(exc)}), 500
 
     @app.get("/api/apply-status/<session_id>")
@@ -252,12 +720,31 @@ def create_app() -> Flask:
         job_session = job_sessions.get(session_id)
         
         if not job_session:
+            saved = job_sessions.load_status(session_id, "apply")
+            if saved:
+                return Response(saved, mimetype="application/json")
             return jsonify({"status": "error", "message": "Session not found"}), 404
 
         if not hasattr(job_session, 'apply_progress'):
             return jsonify({"status": "error", "message": "No application in progress"}), 404
 
-        return jsonify(job_session.apply_progress), 200
+        return jsonify(job_session.apply_status()), 200
+
+    @app.get("/api/apply-status-stream/<session_id>")
+    def stream_apply_status(session_id: str):
+        """Server-Sent Events stream of batch application progress"""
+        job_session = job_sessions.get(session_id)
+        
+        if not job_session:
+            return jsonify({"status": "error", "message": "Session not found"}), 404
+
+        if not hasattr(job_session, 'apply_progress'):
+            return jsonify({"status": "error", "message": "No application in progress"}), 404
+
+        return _event_stream(
+            job_session, "apply",
+            lambda: (job_session.apply_progress['stage'], _dumps(job_session.apply_status()))
+        )
 
     @app.get("/<filename>")
     def serve_static(filename):
@@ -277,9 +764,47 @@ def create_app() -> Flask:
     return app
 
 
-def _process_job_search(session_id: str, payload: Dict):
+def _event_stream(job_session: JobSession, kind: str, snapshot) -> Response:
+    """
+    Stream state snapshots of `job_session` as SSE until a terminal stage is reached.
+    The stream also ends when the session is closed or after SSE_MAX_STREAM_SECONDS;
+    the client then falls back to polling.
+    """
+    def generate():
+        # Subscribe before the first snapshot so no update falls in between
+        events = job_session.subscribe(kind)
+        try:
+            stage, data = snapshot()
+            yield f"data: {data}\n\n"
+            deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+            while stage not in TERMINAL_STAGES:
+                remaining = deadline - time.monotonic()
+                if job_session.closed or remaining <= 0:
+                    return
+                try:
+                    event_stage, event_data = events.get(timeout=min(SSE_KEEPALIVE_SECONDS, remaining))
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if event_data is None:
+                    # Wake-up from JobSession.close
+                    continue
+                stage, data = event_stage, event_data
+                yield f"data: {data}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        finally:
+            job_session.unsubscribe(kind, events)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _process_job_search(session_id: str, payload: Dict, resume_future):
     """Background thread to process job search (NO AUTO-APPLY)"""
-    job_session = job_sessions[session_id]
+    job_session = job_sessions.get(session_id)
     session = None
     
     try:
@@ -291,27 +816,44 @@ def _process_job_search(session_id: str, payload: Dict):
             'Chrome will open in a new window',
             'Please log into LinkedIn when the browser opens'
         ]
+        job_session.publish_job_status()
+
+        session = _driver_pool.acquire(job_session.client_id)
+        reused = session is not None
+        if reused:
+            # Already logged in from an earlier search - skip the login step
+            logger.info("[Session %s] Reusing a logged-in browser", session_id)
+            job_session.scraper_session = session
+            job_session.logged_in = True
+            job_session.login_event.set()
+        else:
+            session = _lazy_imports().JobScraperSession()
+            job_session.scraper_session = session
+            session.initialize_driver()
+
+        # The resume was parsing while Chrome started; stop before login if it failed
+        resume_data = resume_future.result()
+        if "error" in resume_data:
+            raise ValueError(resume_data["error"])
+        job_session.resume_data = resume_data
+
+        if not reused:
+            # Wait for login
+            job_session.stage = 'waiting_login'
+            job_session.message = 'Please log into LinkedIn, then click Continue'
+            job_session.progress = 20
+            job_session.details = [
+                'A Chrome window has opened',
+                'Log into LinkedIn',
+                'Click the Continue button below'
+            ]
+            job_session.publish_job_status()
 
-        session = JobScraperSession()
-        job_session.scraper_session = session
-        session.initialize_driver()
-
-        # Wait for login
-        job_session.stage = 'waiting_login'
-        job_session.message = 'Please log into LinkedIn, then click Continue'
-        job_session.progress = 20
-        job_session.details = [
-            'A Chrome window has opened',
-            'Log into LinkedIn',
-            'Click the Continue button below'
-        ]
-
-        while not job_session.login_confirmed:
-            if job_session.stage == 'error':
-                return
-            threading.Event().wait(1)
+            if not job_session.login_event.wait(timeout=LOGIN_TIMEOUT_SECONDS):
+                raise TimeoutError('Timed out waiting for LinkedIn login')
 
-        session.login_to_linkedin(wait_for_manual_login=False)
+            session.login_to_linkedin(wait_for_manual_login=False)
+            job_session.logged_in = bool(getattr(session, 'is_logged_in', False))
 
         # Search jobs
         job_session.stage = 'scraping'
@@ -321,13 +863,23 @@ def _process_job_search(session_id: str, payload: Dict):
             f'Scraping {payload["num_pages"]} pages',
             'Looking for Easy Apply jobs'
         ]
-
-        jobs = session.search_jobs(
-            query=payload['job_title'],
-            location=payload.get('location', ''),
-            num_pages=payload['num_pages'],
-            fetch_details=payload['fetch_details']
-        )
+        job_session.publish_job_status()
+
+        jobs_cache = _get_jobs_cache()
+        cache_key = _jobs_cache_key(payload)
+        jobs = None
+        if jobs_cache is not None and not payload['refresh']:
+            jobs = jobs_cache.get(cache_key)
+            if jobs is not None:
+                logger.info("[Session %s] Using %d cached jobs", session_id, len(jobs))
+
+        if jobs is None:
+            jobs, processed_jobs = _scrape_and_process(session, payload, job_session)
+            # A scrape that lost pages would keep serving the partial list to everyone
+            if jobs and jobs_cache is not None and getattr(session, 'last_search_complete', False):
+                jobs_cache.set(cache_key, jobs, expire=JOBS_CACHE_TTL)
+        else:
+            processed_jobs = _process_jobs_for_matching(jobs)
 
         if not jobs:
             job_session.stage = 'complete'
@@ -338,25 +890,26 @@ def _process_job_search(session_id: str, payload: Dict):
                 "message": "No Easy Apply jobs found",
                 "matches": []
             }
-            session.cleanup()
+            job_session.publish_job_status()
+            job_session.release_browser()
             return
 
         # Match jobs
         job_session.stage = 'matching'
         job_session.message = f'Found {len(jobs)} jobs! Analyzing matches...'
         job_session.progress = 60
+        job_session.publish_job_status()
 
-        processed_jobs = _process_jobs_for_matching(jobs)
-        matcher = JobMatcher()
         resume_text = _compose_resume_text(job_session.resume_data)
         
-        matches = matcher.get_top_matches(
-            processed_jobs,
-            resume_text,
-            top_n=payload['top_n'],
-            min_score=payload['min_score_filter'],
-            resume_skills=job_session.resume_data.get('technical_skills', [])
-        )
+        with _matcher_lock:
+            matches = _get_matcher().get_top_matches(
+                processed_jobs,
+                resume_text,
+                top_n=payload['top_n'],
+                min_score=payload['min_score_filter'],
+                resume_skills=job_session.resume_data.get('technical_skills', [])
+            )
 
         job_session.matches = matches
         job_session.progress = 100
@@ -371,26 +924,91 @@ def _process_job_search(session_id: str, payload: Dict):
             "resume": _summarize_resume(job_session.resume_data),
             "matches": _format_matches(matches)
         }
+        job_session.publish_job_status()
 
-        print(f"[Session {session_id}] Keeping browser and resume file for applications")
+        logger.info("[Session %s] Keeping browser and resume file for applications", session_id)
 
     except Exception as exc:
-        print(f"[Session {session_id}] ERROR: {str(exc)}")
-        traceback.print_exc()
+        logger.exception("[Session %s] ERROR: %s", session_id, exc)
         job_session.stage = 'error'
         job_session.message = f'Error: {str(exc)}'
         job_session.progress = 0
+        job_session.publish_job_status()
         
         if session:
+            job_session.scraper_session = None
             try:
                 session.cleanup()
             except:
                 pass
+        job_sessions.expire_later(session_id)
+
+
+def _client_id(req) -> str:
+    """This browser's identity from its cookie, or a new one (set on the response)"""
+    client_id = req.cookies.get(CLIENT_COOKIE, "")
+    if _CLIENT_ID_RE.fullmatch(client_id):
+        return client_id
+    return uuid.uuid4().hex
+
+
+def _start_background(fn, *args) -> bool:
+    """Run fn on the shared background pool; False if every worker is busy"""
+    if not _background_slots.acquire(blocking=False):
+        return False
+    future = _background.submit(fn, *args)
+    future.add_done_callback(lambda _f: _background_slots.release())
+    return True
+
+
+def _busy_response():
+    response = jsonify({"status": "error", "message": "Server busy, please retry shortly"})
+    response.headers["Retry-After"] = str(BUSY_RETRY_AFTER_SECONDS)
+    return response, 503
+
+
+def _scrape_and_process(session, payload: Dict, job_session: JobSession) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Scrape on a producer thread and prepare each page for matching as it arrives.
+    Scoring still waits for the full list, since TF-IDF is fitted over every job.
+    """
+    pages = queue.Queue(maxsize=4)
+    done = object()
+    failure = []
+
+    def produce():
+        try:
+            for page_jobs in session.iter_search_jobs(
+                query=payload['job_title'],
+                location=payload.get('location', ''),
+                num_pages=payload['num_pages'],
+                fetch_details=payload['fetch_details']
+            ):
+                pages.put(page_jobs)
+        except Exception as exc:
+            failure.append(exc)
+        finally:
+            pages.put(done)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    jobs, processed_jobs = [], []
+    while (page_jobs := pages.get()) is not done:
+        jobs.extend(page_jobs)
+        processed_jobs.extend(_process_jobs_for_matching(page_jobs))
+        job_session.message = f'Scraped {len(jobs)} jobs so far...'
+        job_session.publish_job_status()
+    producer.join()
+
+    if failure:
+        raise failure[0]
+    return jobs, processed_jobs
 
 
 def _apply_batch_jobs(session_id: str, threshold: float, max_applications: int):
     """Background thread to apply to multiple jobs based on threshold"""
-    job_session = job_sessions[session_id]
+    job_session = job_sessions.get(session_id)
     
     try:
         # Filter matches by threshold
@@ -401,65 +1019,66 @@ def _apply_batch_jobs(session_id: str, threshold: float, max_applications: int):
         
         job_session.apply_progress['total'] = len(qualifying_matches)
         job_session.apply_progress['stage'] = 'applying'
+        job_session.publish_apply_status()
         
-        print(f"[Session {session_id}] Applying to {len(qualifying_matches)} jobs with threshold {threshold}")
+        logger.info("[Session %s] Applying to %d jobs with threshold %s", session_id, len(qualifying_matches), threshold)
         
         if not job_session.scraper_session or not job_session.scraper_session.driver:
             job_session.apply_progress['stage'] = 'error'
             job_session.apply_progress['error'] = 'Browser session expired'
+            job_session.publish_apply_status()
             return
         
+        # The applier uploads from a file path, so the resume hits the disk only now
+        try:
+            job_session.write_resume_file()
+        except OSError as e:
+            logger.error("[Session %s] ❌ Could not write resume file: %s", session_id, e)
+
         # Verify resume file exists
         if not job_session.resume_path or not os.path.exists(job_session.resume_path):
             job_session.apply_progress['stage'] = 'error'
             job_session.apply_progress['error'] = f'Resume file not found: {job_session.resume_path}'
-            print(f"[Session {session_id}] ❌ Resume file missing!")
+            job_session.publish_apply_status()
+            logger.error("[Session %s] ❌ Resume file missing!", session_id)
             return
         
-        print(f"[Session {session_id}] ✅ Resume file exists: {job_session.resume_path}")
+        logger.debug("[Session %s] ✅ Resume file exists: %s", session_id, job_session.resume_path)
         
         # Create applier with callback for questions
         def questions_callback(job_title: str):
             """Callback when additional questions are detected"""
-            print(f"\n{'='*70}")
-            print(f"[Session {session_id}] 🚨 QUESTIONS CALLBACK TRIGGERED")
-            print(f"[Session {session_id}] Job: {job_title}")
-            print(f"{'='*70}\n")
+            logger.info("[Session %s] 🚨 QUESTIONS CALLBACK TRIGGERED - Job: %s", session_id, job_title)
             
             # CRITICAL: Update the progress object that's being polled
-            print(f"[Session {session_id}] Setting waiting_for_questions = True")
+            logger.debug("[Session %s] Setting waiting_for_questions = True", session_id)
+            # Clear before publishing so a confirmation for this job can't be missed
+            job_session.questions_event.clear()
             job_session.apply_progress['waiting_for_questions'] = True
             job_session.apply_progress['current_job_title'] = job_title
-            job_session.questions_confirmed = False
+            job_session.publish_apply_status()
             
-            print(f"[Session {session_id}] Current apply_progress state:")
-            print(f"  - waiting_for_questions: {job_session.apply_progress['waiting_for_questions']}")
-            print(f"  - current_job_title: {job_session.apply_progress['current_job_title']}")
-            print(f"[Session {session_id}] 🔔 Modal flag set - UI should show modal now")
+            logger.debug("[Session %s] 🔔 Modal flag set - UI should show modal now", session_id)
             
             # Wait for user confirmation
-            timeout = 300  # 5 minutes timeout
-            elapsed = 0
-            print(f"[Session {session_id}] ⏳ Waiting for user to answer questions...")
-            
-            while not job_session.questions_confirmed and elapsed < timeout:
-                time.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:  # Log every 10 seconds
-                    print(f"[Session {session_id}] Still waiting... ({elapsed}s)")
+            logger.info("[Session %s] ⏳ Waiting for user to answer questions...", session_id)
+            started = time.monotonic()
+            confirmed = job_session.questions_event.wait(timeout=QUESTIONS_TIMEOUT_SECONDS)
             
-            if elapsed >= timeout:
-                print(f"[Session {session_id}] ⏱️ Timeout waiting for questions confirmation")
+            if not confirmed:
+                logger.warning("[Session %s] ⏱️ Timeout waiting for questions confirmation", session_id)
             else:
-                print(f"[Session {session_id}] ✅ Questions confirmed by user after {elapsed}s")
+                elapsed = time.monotonic() - started
+                logger.info("[Session %s] ✅ Questions confirmed by user after %.0fs", session_id, elapsed)
             
             # Reset flag
-            print(f"[Session {session_id}] Resetting waiting flag")
+            logger.debug("[Session %s] Resetting waiting flag", session_id)
             job_session.apply_progress['waiting_for_questions'] = False
             job_session.apply_progress['current_job_title'] = None
-            print(f"[Session {session_id}] Flag reset - continuing application\n")
+            job_session.publish_apply_status()
+            logger.debug("[Session %s] Flag reset - continuing application", session_id)
         
-        applier = JobApplier(
+        applier = _lazy_imports().JobApplier(
             session=job_session.scraper_session,
             resume_data=job_session.resume_data,
             resume_path=job_session.resume_path,
@@ -476,8 +1095,9 @@ def _apply_batch_jobs(session_id: str, threshold: float, max_applications: int):
             job = match['job']
             job_session.apply_progress['current_job'] = job.get('title', 'Unknown')
             job_session.apply_progress['completed'] = idx
+            job_session.publish_apply_status()
             
-            print(f"[Session {session_id}] Applying to: {job.get('title')}")
+            logger.info("[Session %s] Applying to: %s", session_id, job.get('title'))
             
             try:
                 # Apply to single job
@@ -500,17 +1120,14 @@ def _apply_batch_jobs(session_id: str, threshold: float, max_applications: int):
                 job_session.apply_progress['recent_results'].append(result)
                 job_session.apply_progress['details'].append(result)
                 
-                # Keep only last 5 recent results for display
-                if len(job_session.apply_progress['recent_results']) > 5:
-                    job_session.apply_progress['recent_results'].pop(0)
-                
                 job_session.apply_progress['applied'] = applied
                 job_session.apply_progress['failed'] = failed
+                job_session.publish_apply_status()
                 
                 time.sleep(2)
                 
             except Exception as e:
-                print(f"[Session {session_id}] Error applying to {job.get('title')}: {str(e)}")
+                logger.warning("[Session %s] Error applying to %s: %s", session_id, job.get('title'), e)
                 failed += 1
                 job_session.apply_progress['failed'] = failed
                 job_session.apply_progress['recent_results'].append({
@@ -518,6 +1135,7 @@ def _apply_batch_jobs(session_id: str, threshold: float, max_applications: int):
                     'success': False,
                     'error': str(e)[:100]
                 })
+                job_session.publish_apply_status()
         
         # Complete
         job_session.apply_progress['stage'] = 'complete'
@@ -529,22 +1147,30 @@ def _apply_batch_jobs(session_id: str, threshold: float, max_applications: int):
             'failed': failed,
             'details': job_session.apply_progress['details']
         }
+        job_session.publish_apply_status()
+        
+        logger.info("[Session %s] Batch apply complete: %d applied, %d failed", session_id, applied, failed)
         
-        print(f"[Session {session_id}] Batch apply complete: {applied} applied, {failed} failed")
+        # Hand the logged-in browser to this client's next search
+        job_session.release_browser()
         
         # Cleanup resume file
         if job_session.resume_path and os.path.exists(job_session.resume_path):
             try:
                 os.unlink(job_session.resume_path)
-                print(f"[Session {session_id}] Deleted resume file")
+                logger.info("[Session %s] Deleted resume file", session_id)
             except Exception as e:
-                print(f"[Session {session_id}] Could not delete resume: {e}")
+                logger.warning("[Session %s] Could not delete resume: %s", session_id, e)
         
     except Exception as exc:
-        print(f"[Session {session_id}] Batch apply error: {str(exc)}")
-        traceback.print_exc()
+        logger.exception("[Session %s] Batch apply error: %s", session_id, exc)
         job_session.apply_progress['stage'] = 'error'
         job_session.apply_progress['error'] = str(exc)
+        job_session.publish_apply_status()
+    
+    finally:
+        if job_session.apply_progress['stage'] in TERMINAL_STAGES:
+            job_sessions.expire_later(session_id)
 
 
 def _parse_form_data(req) -> Tuple[Dict, str]:
@@ -555,6 +1181,7 @@ def _parse_form_data(req) -> Tuple[Dict, str]:
         fetch_details = req.form.get("fetch_details", "false").lower() == "true"
         top_n = int(req.form.get("top_n", 15))
         min_score_filter = float(req.form.get("min_score_filter", 0.25))
+        refresh = (req.args.get("refresh") or req.form.get("refresh") or "").lower() in ("1", "true")
     except ValueError:
         return {}, "Invalid numeric value in form data."
 
@@ -571,21 +1198,58 @@ def _parse_form_data(req) -> Tuple[Dict, str]:
         "num_pages": num_pages,
         "fetch_details": fetch_details,
         "top_n": top_n,
-        "min_score_filter": min_score_filter
+        "min_score_filter": min_score_filter,
+        "refresh": refresh
     }
     return payload, ""
 
 
+def _parse_batch_apply_params(req) -> Tuple[Dict, str]:
+    # Tiny body: parse it without keeping a cached copy on the request.
+    # This starts real applications, so a body that isn't a JSON object is
+    # rejected; defaults only fill in keys that are absent.
+    raw = req.get_data(cache=False)
+    data = {}
+    if raw.strip():
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return {}, "Request body must be a JSON object."
+
+    threshold = data.get('threshold', 0.6)
+    max_applications = data.get('max_applications', 10)
+    if isinstance(threshold, bool) or isinstance(max_applications, bool):
+        return {}, "threshold and max_applications must be numbers."
+    try:
+        threshold = float(threshold)
+        max_applications = int(max_applications)
+    except (TypeError, ValueError):
+        return {}, "threshold and max_applications must be numbers."
+
+    if not 0.0 <= threshold <= 1.0:
+        return {}, "threshold must be between 0 and 1."
+    if not 1 <= max_applications <= 50:
+        return {}, "max_applications must be between 1 and 50."
+
+    return {"threshold": threshold, "max_applications": max_applications}, ""
+
+
+def _jobs_cache_key(payload: Dict) -> str:
+    key = f"{payload['job_title']}|{payload['location']}|{payload['num_pages']}|{payload['fetch_details']}"
+    return hashlib.sha1(key.lower().encode()).hexdigest()
+
+
 def _allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
-def _save_resume(file_storage) -> Path:
-    safe_name = secure_filename(file_storage.filename) or "resume.pdf"
-    unique_name = f"{Path(safe_name).stem}_{uuid.uuid4().hex}.pdf"
-    save_path = UPLOAD_DIR / unique_name
-    file_storage.save(save_path)
-    return save_path
+def _read_resume(file_storage) -> Tuple[str, bytes]:
+    # The stored name never uses the client's filename, so no sanitising is needed.
+    # Reads are capped at MAX_UPLOAD_BYTES; larger bodies were already refused with 413.
+    name = f"resume_{uuid.uuid4().hex}.pdf"
+    return name, file_storage.stream.read(MAX_UPLOAD_BYTES)
 
 
 def _compose_resume_text(resume: Dict) -> str:
@@ -600,18 +1264,15 @@ def _compose_resume_text(resume: Dict) -> str:
 
 
 def _process_jobs_for_matching(jobs: List[Dict]) -> List[Dict]:
-    processed = []
-    for job in jobs:
-        processed.append({
-            "title": job.get("title") or "Unknown",
-            "company": job.get("company") or "Unknown",
-            "location": job.get("location") or "Remote",
-            "link": job.get("link") or "",
-            "summary": job.get("summary") or "",
-            "key_skills": job.get("key_skills", []),
-            "platform": job.get("platform", "LinkedIn")
-        })
-    return processed
+    return [{
+        "title": job.get("title") or "Unknown",
+        "company": job.get("company") or "Unknown",
+        "location": job.get("location") or "Remote",
+        "link": job.get("link") or "",
+        "summary": job.get("summary") or "",
+        "key_skills": job.get("key_skills", []),
+        "platform": job.get("platform", "LinkedIn")
+    } for job in jobs]
 
 
 def _summarize_resume(resume: Dict) -> Dict:
@@ -625,9 +1286,28 @@ def _summarize_resume(resume: Dict) -> Dict:
     }
 
 
+def _drop_repeated_phrase(words: List[str]) -> List[str]:
+    """Remove the first phrase of 2+ words that is immediately repeated, e.g. 'A B A B C' -> 'A B C'"""
+    n = len(words)
+    for i in range(n - 3):
+        # Only phrase lengths that still fit twice in the remaining words
+        for k in range(2, (n - i) // 2 + 1):
+            if words[i + k] == words[i] and words[i:i + k] == words[i + k:i + 2 * k]:
+                return words[:i + k] + words[i + 2 * k:]
+    return words
+
+
 def _format_matches(matches: List[Dict]) -> List[Dict]:
+    # Round every score in one vectorised step; tolist() gives plain floats for JSON
+    scores = np.array(
+        [[match.get(field, 0) or 0 for field in _SCORE_FIELDS] for match in matches],
+        dtype=float
+    ).reshape(-1, len(_SCORE_FIELDS))
+    scores[:, :-1] = np.round(scores[:, :-1], 4)
+    scores[:, -1] = np.round(scores[:, -1], 2)
+
     formatted = []
-    for match in matches:
+    for match, score in zip(matches, scores.tolist()):
         job = match.get("job", {})
         
         # BACKUP: Clean title if still duplicated
@@ -648,30 +1328,16 @@ def _format_matches(matches: List[Dict]) -> List[Dict]:
                 else:
                     # Check for repeated phrases with extra text
                     # Pattern: "Python Developer Python Developer with verification"
-                    for i in range(len(words) - 3):
-                        for j in range(i + 2, len(words)):
-                            if words[i:j] == words[j:j+(j-i)]:
-                                # Found duplicate, remove it
-                                title = ' '.join(words[:j] + words[j+(j-i):])
-                                break
-                        else:
-                            continue
-                        break
+                    title = ' '.join(_drop_repeated_phrase(words))
             
             # Method 2: Regex pattern for common duplicates
-            # Pattern like "Developer Developer" or "Python Developer Python Developer"
-            patterns = [
-                (r'\b([A-Za-z]+\s+Developer)\s+\1\b', r'\1'),
-                (r'\b([A-Za-z]+\s+Engineer)\s+\1\b', r'\1'),
-                (r'\b(Python\s+Developer)\s+\1\b', r'\1'),
-            ]
-            for pattern, replacement in patterns:
-                title = re.sub(pattern, replacement, title, flags=re.IGNORECASE)
+            for pattern, replacement in _DEDUP_PATTERNS:
+                title = pattern.sub(replacement, title)
         
         # Clean company name
         company = job.get("company", "Company not specified")
         if company and company.strip() and company != "Company not specified":
-            company = re.sub(r'\s+', ' ', company.strip())
+            company = _WS_RE.sub(' ', company.strip())
         
         formatted.append({
             "title": title,
@@ -679,12 +1345,7 @@ def _format_matches(matches: List[Dict]) -> List[Dict]:
             "location": job.get("location"),
             "link": job.get("link"),
             "platform": job.get("platform", "LinkedIn"),
-            "final_score": round(match.get("final_score", 0) or 0, 4),
-            "similarity_score": round(match.get("similarity_score", 0) or 0, 4),
-            "experience_score": round(match.get("experience_score", 0) or 0, 4),
-            "skills_score": round(match.get("skills_score", 0) or 0, 4),
-            "title_relevance": round(match.get("title_relevance", 0) or 0, 4),
-            "skill_match_percentage": round(match.get("skill_match_percentage", 0.0) or 0.0, 2),
+            **dict(zip(_SCORE_FIELDS, score)),
             "matched_skills": match.get("matched_skills", [])[:10],
             "missing_skills": match.get("missing_skills", [])[:10]
         })
@@ -695,4 +1356,5 @@ app = create_app()
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run(host="0.0.0.0", port=5000, debug=os.environ.get("FLASK_DEBUG") == "1", threaded=True)
\ No newline at end of file